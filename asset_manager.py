@@ -0,0 +1,176 @@
+import os
+import threading
+from collections import OrderedDict
+import pygame
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = os.path.join(BASE_DIR, "assets")
+CACHE_DIR = os.path.join(BASE_DIR, ".asset_cache")   # 시작 때 쓰는 스케일된 이미지 디스크 캐시
+
+# 첫 화면에 꼭 필요한 (파일, 크기, 알파) 목록
+# (배경은 화면 크기에 맞춰 Game 에서 따로 추가)
+PRELOAD = [
+    ("kirby.png", (70, 70), True),
+    ("heart.png", (32, 32), True),
+]
+
+# 첫 화면 이후에 필요한 이미지 (백그라운드 스레드에서 PNG 디코딩)
+DEFERRED = [
+    ("enemy.png", (48, 48), True),
+    ("item.png", (32, 32), True),
+]
+
+
+class AssetManager:
+    def __init__(self, asset_dir=ASSET_DIR, max_scaled=64, cache_dir=CACHE_DIR):
+        self.asset_dir = asset_dir
+        self.max_scaled = max_scaled
+        self.cache_dir = cache_dir      # None 이면 디스크 캐시 사용 안 함
+        self._raw = {}                  # (파일, 알파) -> 원본 surface
+        self._decoded = {}              # 파일 또는 스케일 키 -> 백그라운드에서 디코딩만 끝난 surface
+        self._persist = set()           # 디스크에 캐시할 스케일 키 (preload/decode 목록만)
+        self._lock = threading.Lock()
+        self._scaled = OrderedDict()    # (파일, 크기, 알파) -> 스케일된 surface (LRU)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+
+    def _convert(self, img, alpha):
+        # 디스플레이가 없으면(헤드리스) convert 를 건너뜀
+        if pygame.display.get_surface() is None:
+            return img
+        return img.convert_alpha() if alpha else img.convert()
+
+    def _load_raw(self, name, alpha):
+        key = (name, alpha)
+        img = self._raw.get(key)
+        if img is None:
+            with self._lock:
+                img = self._decoded.pop(name, None)
+            if img is None:
+                img = pygame.image.load(os.path.join(self.asset_dir, name))
+            img = self._convert(img, alpha)
+            with self._lock:
+                self._raw[key] = img
+                self._decoded.pop(name, None)  # 그 사이 백그라운드가 넣은 것은 버림
+        return img
+
+    def _loaded(self, name):
+        return (name, True) in self._raw or (name, False) in self._raw
+
+    # 스케일된 결과 파일 (알파는 PNG, 불투명은 BMP)
+    def _cache_path(self, key):
+        name, size, alpha = key
+        stem = os.path.splitext(name)[0]
+        return os.path.join(self.cache_dir, f"{stem}_{size[0]}x{size[1]}" + ("_a.png" if alpha else ".bmp"))
+
+    # 원본보다 새 캐시 파일만 사용 (원본 PNG 디코딩 + smoothscale 생략)
+    def _load_cached(self, key):
+        if not self.cache_dir or key not in self._persist:
+            return None
+        path = self._cache_path(key)
+        try:
+            if os.path.getmtime(path) < os.path.getmtime(os.path.join(self.asset_dir, key[0])):
+                return None
+            return pygame.image.load(path)
+        except (OSError, pygame.error):
+            return None
+
+    def _save_cached(self, key, surf):
+        if not self.cache_dir or key not in self._persist:
+            return
+        path = self._cache_path(key)
+        tmp = f"{path}.{os.getpid()}.tmp{os.path.splitext(path)[1]}"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pygame.image.save(surf, tmp)
+            os.replace(tmp, path)
+        except (OSError, pygame.error):
+            pass
+
+    # ✅ 이미지 요청 (캐시된 공유 surface 반환 - 직접 수정 금지)
+    def image(self, name, size=None, alpha=True):
+        key = (name, tuple(size) if size else None, alpha)
+        surf = self._scaled.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._scaled.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        with self._lock:
+            surf = self._decoded.pop(key, None)
+        if surf is None and size:
+            surf = self._load_cached(key)
+        if surf is not None:
+            surf = self._convert(surf, alpha)
+            self.disk_hits += 1
+        else:
+            surf = self._load_raw(name, alpha)
+            if size and surf.get_size() != tuple(size):
+                surf = pygame.transform.smoothscale(surf, tuple(size))
+                self._save_cached(key, surf)
+        with self._lock:
+            self._scaled[key] = surf
+            self._decoded.pop(key, None)
+        while len(self._scaled) > self.max_scaled:
+            self._scaled.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    # ✅ 시작 시 한 번에 로드
+    def preload(self, entries=PRELOAD):
+        for name, size, alpha in entries:
+            self._persist.add((name, tuple(size), alpha))
+            try:
+                self.image(name, size, alpha)
+            except (pygame.error, FileNotFoundError):
+                pass
+
+    # PNG 디코딩만 미리 해둠 (convert/스케일은 처음 요청할 때 메인 스레드에서)
+    #   디스크 캐시가 있으면 스케일된 파일을, 없으면 원본을 디코딩
+    #   (메인 스레드와 같이 돌므로 _raw/_scaled/_decoded 확인과 추가는 항상 잠금 안에서)
+    def decode(self, entries):
+        for name, size, alpha in entries:
+            key = (name, tuple(size), alpha)
+            with self._lock:
+                self._persist.add(key)
+                if key in self._scaled or key in self._decoded:
+                    continue
+            img = self._load_cached(key)
+            if img is not None:
+                with self._lock:
+                    if key not in self._scaled:
+                        self._decoded.setdefault(key, img)
+                continue
+            with self._lock:
+                if self._loaded(name) or name in self._decoded:
+                    continue
+            try:
+                img = pygame.image.load(os.path.join(self.asset_dir, name))
+            except (pygame.error, FileNotFoundError):
+                continue
+            with self._lock:
+                if not self._loaded(name):
+                    self._decoded.setdefault(name, img)
+
+    def clear(self):
+        with self._lock:
+            self._raw.clear()
+            self._decoded.clear()
+            self._scaled.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_hits": self.disk_hits,
+            "raw": len(self._raw),
+            "scaled": len(self._scaled),
+        }
+
+
+# 모듈 전역 공유 인스턴스
+assets = AssetManager()
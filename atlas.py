@@ -0,0 +1,39 @@
+import pygame
+from asset_manager import assets
+
+
+# ✅ 여러 스프라이트를 한 장의 surface 에 모아둔 아틀라스 (렌더 해상도에 맞춰 미리 스케일)
+class SpriteAtlas:
+    def __init__(self, sprites, scale=(1.0, 1.0), max_width=1024, padding=1):
+        sx, sy = scale
+        images = {}
+        for name, (w, h) in sprites:
+            size = (max(1, round(w * sx)), max(1, round(h * sy)))
+            try:
+                images[name] = assets.image(name, size)
+            except (pygame.error, FileNotFoundError):
+                continue
+
+        # 선반(shelf) 방식: 키 큰 것부터 한 줄씩 채움
+        self.areas = {}
+        x = y = shelf_h = width = 0
+        for name, img in sorted(images.items(), key=lambda kv: -kv[1].get_height()):
+            w, h = img.get_size()
+            if x and x + w > max_width:
+                x, y = 0, y + shelf_h + padding
+                shelf_h = 0
+            self.areas[name] = pygame.Rect(x, y, w, h)
+            x += w + padding
+            shelf_h = max(shelf_h, h)
+            width = max(width, x)
+
+        self.surface = pygame.Surface((max(1, width), max(1, y + shelf_h)), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        for name, rect in self.areas.items():
+            self.surface.blit(images[name], rect)
+
+    # Surface.blits 용 (source, dest, area)
+    def blit_args(self, name, dest):
+        return (self.surface, dest, self.areas[name])
@@ -1,24 +1,32 @@
-import os
-import pygame
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-ASSET_DIR = os.path.join(BASE_DIR, "assets")
+from asset_manager import assets
 
 class Background:
-    def __init__(self, screen):
+    def __init__(self, screen, speed=50):
+        self.speed = speed  # 0 이면 정적 배경 (더티 렉트 렌더링 가능)
+        self.span = screen.get_height()  # 스크롤 한 바퀴 길이 (게임 좌표)
+        self.y = self.prev_y = 0.0
+        self.resize(screen)
+
+    # 그릴 대상(렌더 해상도)이 바뀌면 배경 이미지를 그 크기로 다시 준비
+    def resize(self, screen):
         self.screen = screen
-        path = os.path.join(ASSET_DIR, "bg.png")
-        img = pygame.image.load(path).convert()
-        w, h = screen.get_size()
-        self.image = pygame.transform.smoothscale(img, (w, h))
+        self.image = assets.image("bg.png", screen.get_size(), alpha=False)
         self.w, self.h = self.image.get_size()
-        self.y = 0
 
     def update(self, dt):
-        self.y += 50 * dt
-        if self.y >= self.h:
-            self.y = 0
+        self.prev_y = self.y
+        self.y += self.speed * dt
+        if self.y >= self.span:
+            self.y -= self.span
+
+    # 배경이 화면 전체를 덮는지 (덮으면 fill 생략)
+    def covers(self, surface):
+        return self.w >= surface.get_width() and self.h >= surface.get_height()
 
-    def draw(self):
-        self.screen.blit(self.image, (0, -self.y))
-        self.screen.blit(self.image, (0, self.h - self.y))
+    def draw(self, alpha=1.0):
+        prev = self.prev_y
+        if self.y < prev:  # 한 바퀴 돈 직후
+            prev -= self.span
+        y = round((prev + (self.y - prev) * alpha) * self.h / self.span) % self.h
+        self.screen.blit(self.image, (0, -y))
+        self.screen.blit(self.image, (0, self.h - y))
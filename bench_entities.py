@@ -0,0 +1,77 @@
+# 객체 방식 vs numpy(EntityStore) 방식 비교
+#  1) 같은 시드에서 두 방식의 게임 결과가 같은지 확인
+#  2) 적 수에 따른 프레임당 update 비용 측정
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game import Game, SIM_DT
+import entity_store
+
+DT = SIM_DT
+
+
+def snapshot(game):
+    if game.store is not None:
+        s = game.store
+        a = s.alive
+        order = a.nonzero()[0]
+        pos = sorted(zip(s.kind[order].tolist(), s.x[order].astype(int).tolist(), s.y[order].tolist()))
+    else:
+        pos = sorted([(0, e.rect.x, e.y) for e in game.enemies] +
+                     [(1, it.rect.x, it.y) for it in game.items])
+    return game.score, game.life, pos
+
+
+def parity(frames=120 * 120, seed=1234):
+    results = []
+    for backend in ("objects", "numpy"):
+        game = Game(entity_backend=backend, seed=seed)
+        trace = []
+        for _ in range(frames):
+            game.update(DT)
+            if game.life <= 1:
+                game.life = game.max_life  # 끝까지 돌리기 위해 생명 보충
+            trace.append(snapshot(game))
+        results.append(trace)
+    mismatch = next((i for i, (a, b) in enumerate(zip(*results)) if a != b), None)
+    print("parity:", "OK" if mismatch is None else f"MISMATCH at frame {mismatch}")
+    return mismatch is None
+
+
+def fill(game, n):
+    for _ in range(n):
+        x = game.rng.randint(50, game.width - 50)
+        if game.store is not None:
+            game.store.spawn_enemy(game.width, spawn_x=x, rng=game.rng)
+        else:
+            e = game.enemy_pool.acquire(game.width, spawn_x=x, rng=game.rng)
+            game.enemies.append(e)
+
+
+def bench(n, backend, frames=120):
+    game = Game(entity_backend=backend, seed=0)
+    game.height = 10 ** 9  # 화면 밖 정리로 개수가 줄지 않게
+    fill(game, n)
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.invincible_time = 1.0
+        game.update(DT)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    if not entity_store.available():
+        print("numpy 가 없어서 비교할 수 없습니다")
+        return
+    ok = parity()
+    print(f"{'N':>6} {'objects ms':>12} {'numpy ms':>10}")
+    for n in (10, 100, 1000, 5000, 10000):
+        print(f"{n:>6} {bench(n, 'objects'):>12.3f} {bench(n, 'numpy'):>10.3f}")
+    assert ok
+
+
+if __name__ == "__main__":
+    main()
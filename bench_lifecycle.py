@@ -0,0 +1,41 @@
+# 30분 연속 플레이를 헤드리스로 시뮬레이션해서
+# 엔티티 리스트/풀 크기가 계속 늘어나지 않는지 확인
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game import Game, SIM_DT
+
+MINUTES = 30
+DT = SIM_DT
+
+
+def main():
+    game = Game(seed=30)
+    frames = int(MINUTES * 60 / DT)
+    peak = {}
+    start = time.perf_counter()
+    for i in range(frames):
+        game.invincible_time = 1.0  # 죽지 않게 유지
+        game.update(DT)
+        for k, v in game.entity_counts().items():
+            peak[k] = max(peak.get(k, 0), v)
+    elapsed = time.perf_counter() - start
+
+    counts = game.entity_counts()
+    print(f"simulated {MINUTES} min ({frames} frames) in {elapsed:.2f}s")
+    print("final:", counts)
+    print("peak: ", peak)
+    print("created:", game.enemy_pool.created + game.item_pool.created,
+          "reused:", game.enemy_pool.reused + game.item_pool.reused)
+
+    # 화면 높이 / 최소 속도 만큼만 살아있을 수 있음 -> 수십 개 이하로 평탄해야 함
+    assert peak["enemies"] < 32, peak
+    assert peak["items"] < 8, peak
+    assert game.enemy_pool.created < 64
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# 프레임당 그리기 비용 비교
+#  - legacy : 예전 Game.draw (fill + 배경 + 개별 blit + 매 프레임 font.render + flip)
+#  - scroll : Renderer, 스크롤 배경 (전체 flip)
+#  - static : Renderer, 정적 배경 (더티 렉트만 update)
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from game import Game, SIM_DT
+
+FRAMES = 600
+
+
+def legacy_draw(game):
+    screen = game.screen
+    screen.fill((0, 0, 0))
+    game.bg.draw()
+    for e in game.enemies:
+        e.draw(screen)
+    for it in game.items:
+        it.draw(screen)
+    game.player.draw(screen)
+    if game.heart_img:
+        for i in range(game.life):
+            screen.blit(game.heart_img, (10 + i * 36, 10))
+    screen.blit(game.font.render(f"Score: {game.score}", True, (255,255,255)), (10, 50))
+    screen.blit(game.font.render(f"High: {game.highscore}", True, (255,215,0)), (10, 75))
+    pygame.display.flip()
+
+
+def renderer_draw(game):
+    game.draw()
+    game.renderer.present()
+
+
+def bench(mode):
+    game = Game(seed=3, scroll_bg=(mode != "static"))
+    draw = legacy_draw if mode == "legacy" else renderer_draw
+    total = 0.0
+    for _ in range(FRAMES):
+        game.invincible_time = 1.0
+        game.update(SIM_DT)
+        game.update(SIM_DT)
+        t0 = time.perf_counter()
+        draw(game)
+        total += time.perf_counter() - t0
+    return game, total / FRAMES * 1000
+
+
+def main():
+    results = {}
+    for mode in ("legacy", "scroll", "static"):
+        game, ms = bench(mode)
+        results[mode] = ms
+        print(f"{mode:>7}: {ms:.3f} ms/frame  (HUD renders: {getattr(game.renderer, 'hud_renders', 0)})")
+
+    # 더티 렉트 결과가 전체 다시 그린 화면과 같은지 확인
+    game, _ = bench("static")
+    partial = game.screen.copy()
+    game.renderer.invalidate()
+    game.draw()
+    same = pygame.image.tostring(partial, "RGB") == pygame.image.tostring(game.screen, "RGB")
+    print("dirty-rect output matches full redraw:", "OK" if same else "MISMATCH")
+    assert same
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# 창 크기 x 렌더 배율별 그리기+화면 반영 FPS (게임 영역은 비율 유지 + 레터박스)
+#  - 1.0  : 창에 맞춘 해상도 그대로 (800x600 은 기존 더티 렉트 경로, 그 외는 아틀라스)
+#  - 0.5  : 절반 해상도 surface 에 그린 뒤 정확히 2배로 한 번 확대
+#    (0.75 같은 배율은 지원하지 않음: 2배가 아닌 확대는 창 해상도로 그리는 것보다 느림)
+#  - auto : 그리기 시간이 예산을 넘을 때만 0.5 로 전환 (괄호 안은 마지막 배율)
+#  - crowd N : 화면에 적 N개를 깔아 스프라이트 blit 비용이 큰 경우
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game import Game, SIM_DT
+
+WARMUP = 150   # auto 가 배율을 고를 시간 (측정 제외)
+FRAMES = 300
+WINDOWS = [(800, 600), (1280, 720), (1920, 1080), (2560, 1440)]
+SCALES = [1.0, 0.5, "auto"]
+CROWDS = [0, 200, 600]
+
+
+def bench(window, scale, crowd=0):
+    game = Game(seed=3, render_scale=scale)
+    game.set_display(window)
+    for _ in range(crowd):
+        game.spawn_enemy()
+    for e in game.enemies:
+        e.y = e.prev_y = game.rng.uniform(0, game.height - 48)
+    total = 0.0
+    for i in range(WARMUP + FRAMES):
+        if not crowd:
+            game.invincible_time = 1.0
+            game.update(SIM_DT)
+            game.update(SIM_DT)
+        t0 = time.perf_counter()
+        game.draw(0.5)
+        game.renderer.present()
+        if i >= WARMUP:
+            total += time.perf_counter() - t0
+    return game, FRAMES / total
+
+
+def main():
+    for crowd in CROWDS:
+        title = f"crowd {crowd}" if crowd else "normal"
+        print(f"{title:>10}  " + "  ".join(f"{'x' + str(s):>11}" for s in SCALES) + "  (FPS, draw+present only)")
+        for window in WINDOWS:
+            row = []
+            for scale in SCALES:
+                game, fps = bench(window, scale, crowd)
+                assert game.screen.get_size() == window
+                level = f"({game.renderer.level})" if scale == "auto" else ""
+                row.append(f"{fps:6.0f}{level:>5}")
+            print(f"{window[0]:>4}x{window[1]:<5}  " + "  ".join(f"{c:>11}" for c in row))
+
+    # 창 크기를 바꿔도 비율 유지 + 아틀라스/배경이 새 해상도로 다시 만들어지는지
+    game = Game(seed=3, render_scale=0.5)
+    r = game.renderer
+    game.set_display((1600, 1200))
+    assert r.target.get_size() == (800, 600) and (r.sx, r.sy) == (1.0, 1.0)
+    assert r.atlas.areas["enemy.png"].size == (48, 48)
+    assert game.bg.image.get_size() == (800, 600)
+    game.set_display((800, 600))
+    assert r.atlas.areas["enemy.png"].size == (24, 24)
+    game.set_display((1920, 1080))
+    assert r.view == (240, 0, 1440, 1080) and r.target.get_size() == (720, 540)
+    game.set_display((1281, 721))
+    assert r.view.w % 2 == 0 and r.view.h % 2 == 0
+    game.draw(0.5)
+
+    game = Game(seed=3)
+    r = game.renderer
+    game.set_display((1920, 1080))
+    w, h = r.atlas.areas["kirby.png"].size
+    assert w == h == 126, (w, h)   # 가로/세로 같은 배율 (70 x 1.8)
+    print("resize rebuild / uniform scale: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# 공간 해시 vs 전체 순회(brute force) 충돌 검사 비교
+#  - ms/f : 매 프레임 전체 이동 + 플레이어 충돌 검사
+#  - us/q : 이동 없이 rect 질의 한 번
+#  스텝당 질의가 하나뿐이면 이동 갱신 비용 때문에 전체 순회가 더 빠름 (Simulation 은 전체 순회 사용)
+#  공간 해시는 한 스텝에 질의가 여러 번 필요할 때(적끼리 충돌, 자석 아이템 등) 쓰는 용도
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from spatial_hash import SpatialHash
+
+W, H = 800, 600
+FRAMES = 100
+
+
+class Body:
+    def __init__(self, rect):
+        self.rect = rect
+
+
+def make_bodies(n):
+    return [Body(pygame.Rect(random.randint(0, W - 48), random.randint(-160, H), 48, 48)) for _ in range(n)]
+
+
+def copy_bodies(bodies):
+    return [Body(b.rect.copy()) for b in bodies]
+
+
+def brute(bodies, player):
+    hits = 0
+    for _ in range(FRAMES):
+        for b in bodies:
+            b.rect.y += 1
+            if b.rect.colliderect(player):
+                hits += 1
+    return hits
+
+
+def hashed(bodies, player):
+    grid = SpatialHash(cell_size=64)
+    for b in bodies:
+        grid.insert(b, b.rect)
+    hits = 0
+    for _ in range(FRAMES):
+        for b in bodies:
+            b.rect.y += 1
+            grid.move(b, b.rect)
+        hits += len(grid.query_rect(player))
+    return hits
+
+
+def query_only(bodies, player, queries=1000):
+    grid = SpatialHash(cell_size=64)
+    for b in bodies:
+        grid.insert(b, b.rect)
+    t0 = time.perf_counter()
+    for _ in range(queries):
+        [b for b in bodies if b.rect.colliderect(player)]
+    t1 = time.perf_counter()
+    for _ in range(queries):
+        grid.query_rect(player)
+    t2 = time.perf_counter()
+    return (t1 - t0) / queries * 1e6, (t2 - t1) / queries * 1e6
+
+
+def main():
+    player = pygame.Rect(W // 2 - 35, H - 115, 70, 70)
+    print(f"{'N':>6} {'brute ms/f':>11} {'hash ms/f':>10} {'brute us/q':>11} {'hash us/q':>10}")
+    for n in (10, 100, 1000, 10000):
+        random.seed(n)
+        bodies = make_bodies(n)
+        t0 = time.perf_counter()
+        a = brute(copy_bodies(bodies), player)
+        t1 = time.perf_counter()
+        b = hashed(copy_bodies(bodies), player)
+        t2 = time.perf_counter()
+        assert a == b, (a, b)
+        bq, hq = query_only(bodies, player)
+        print(f"{n:>6} {(t1 - t0) / FRAMES * 1000:>11.3f} {(t2 - t1) / FRAMES * 1000:>10.3f} {bq:>11.1f} {hq:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# 시작 ~ 첫 프레임까지 걸리는 시간 (새 프로세스로 매번 측정)
+#  - baseline : 최적화 전 원본 커밋의 Game (git archive 로 임시 폴더에 풀어서 실행)
+#  - staged : 지금 Game (필요한 모듈만, 기본 폰트, 사운드/나머지 이미지는 백그라운드,
+#             스케일된 시작 이미지는 디스크 캐시에서)
+#  - staged-nocache : 디스크 캐시 없이 (첫 실행과 같음)
+import os
+import sys
+import time
+import statistics
+import tarfile
+import tempfile
+import subprocess
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNS = 20
+
+BASELINE_REV = "700b76a"   # 최적화 전 원본 트리
+
+# 원본 Game 을 그대로 실행하고 첫 flip 에서 종료
+BASELINE = r'''
+import time, pygame
+print("PYGAME", time.time())
+_flip = pygame.display.flip
+def flip():
+    _flip()
+    print("READY", time.time(), flush=True)
+    raise SystemExit
+pygame.display.flip = flip
+from game import Game
+Game().run()
+'''
+
+STAGED = r'''
+import time, pygame
+print("PYGAME", time.time())
+from asset_manager import assets
+assets.cache_dir = CACHE_DIR
+from game import Game
+from screens import PlayScreen
+game = Game()
+PlayScreen(game).step()
+print("READY", time.time())
+print("STAGES", game.startup.report())
+'''
+
+
+def measure(code, cwd=BASE_DIR):
+    env = dict(os.environ, SDL_VIDEODRIVER=os.environ.get("SDL_VIDEODRIVER", "dummy"),
+               SDL_AUDIODRIVER=os.environ.get("SDL_AUDIODRIVER", "dummy"),
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.time()
+    out = subprocess.run([sys.executable, "-c", f"BASE_DIR = {BASE_DIR!r}\n" + code],
+                         cwd=cwd, env=env, capture_output=True, text=True, check=True).stdout
+    lines = out.splitlines()
+    ready = float(next(line for line in lines if line.startswith("READY")).split()[1])
+    imported = float(next(line for line in lines if line.startswith("PYGAME")).split()[1])
+    stages = next((line[7:] for line in lines if line.startswith("STAGES")), "")
+    # (전체, import pygame 이후) - pygame import 자체는 양쪽이 같고 편차가 큼
+    return ((ready - start) * 1000, (ready - imported) * 1000), stages
+
+
+# 원본 커밋을 임시 폴더에 풀기
+def extract_baseline(dest):
+    archive = subprocess.run(["git", "archive", BASELINE_REV], cwd=BASE_DIR,
+                             capture_output=True, check=True).stdout
+    path = os.path.join(dest, "baseline.tar")
+    with open(path, "wb") as f:
+        f.write(archive)
+    with tarfile.open(path) as tar:
+        tar.extractall(os.path.join(dest, "baseline"))
+    return os.path.join(dest, "baseline")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_dir = extract_baseline(tmp)
+        # 두 쪽 모두 미리 바이트코드 컴파일 (PYTHONDONTWRITEBYTECODE 환경에서도 공정하게)
+        for path in (baseline_dir, BASE_DIR):
+            subprocess.run([sys.executable, "-m", "compileall", "-q", "-l", path], check=True)
+        cache = repr(os.path.join(tmp, "asset_cache"))
+        staged = "CACHE_DIR = " + cache + "\n" + STAGED
+        measure(staged)  # 디스크 캐시 채우기
+        for name, code, cwd in (("baseline", BASELINE, baseline_dir),
+                                ("staged-nocache", "CACHE_DIR = None\n" + STAGED, BASE_DIR),
+                                ("staged", staged, BASE_DIR)):
+            report(name, [measure(code, cwd) for _ in range(RUNS)])
+
+
+def report(name, results):
+    times = [t for (t, _), _ in results]
+    after = [t for (_, t), _ in results]
+    print(f"{name}: time-to-first-frame median {statistics.median(times):.1f} ms "
+          f"(min {min(times):.1f}, max {max(times):.1f}), "
+          f"after pygame import median {statistics.median(after):.1f} ms")
+    if results[-1][1]:
+        print("   ", results[-1][1])
+
+
+if __name__ == "__main__":
+    main()
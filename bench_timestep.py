@@ -0,0 +1,63 @@
+# 고정 스텝 시뮬레이션 결정성 확인
+#  1) 같은 시드 + 같은 입력 -> 매 스텝 상태 해시가 같은지
+#  2) 렌더 FPS(30 / 60 / 144)가 달라도 같은 스텝에서 같은 상태인지
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from game import Game
+from simulation import SIM_HZ
+from player import KeyState
+
+SECONDS = 60
+
+
+LEFT = KeyState([pygame.K_LEFT])
+RIGHT = KeyState([pygame.K_RIGHT])
+
+
+# 스크립트 입력: 2초마다 좌/우 방향 전환
+def scripted_keys(tick):
+    return LEFT if (tick // (SIM_HZ * 2)) % 2 else RIGHT
+
+
+# 매 스텝 상태 해시를 기록하는 Game
+class TracedGame(Game):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trace = []
+
+    def update(self, dt, keys=None):
+        super().update(dt, scripted_keys(self.tick))
+        self.trace.append(self.state_hash())
+        if self.life <= 1:
+            self.life = self.max_life  # 끝까지 돌리기 위해 생명 보충
+
+
+def run(fps, seed=7):
+    game = TracedGame(seed=seed)
+    start = time.perf_counter()
+    for _ in range(SECONDS * fps):
+        game.advance(1.0 / fps)
+    return game.trace, time.perf_counter() - start
+
+
+def main():
+    base, _ = run(60)
+    again, _ = run(60)
+    print("same seed, same input:", "OK" if base == again else "MISMATCH")
+    ok = base == again
+    for fps in (30, 144):
+        trace, elapsed = run(fps)
+        n = min(len(base), len(trace))
+        same = base[:n] == trace[:n]
+        ok = ok and same
+        print(f"render {fps:>3} fps: {n} ticks compared, {'OK' if same else 'MISMATCH'} ({elapsed:.2f}s)")
+    assert ok
+
+
+if __name__ == "__main__":
+    main()
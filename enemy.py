@@ -1,27 +1,33 @@
-import os
-import pygame
 import random
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-ASSET_DIR = os.path.join(BASE_DIR, "assets")
+from asset_manager import assets
 
 class Enemy:
-    def __init__(self, screen_width, spawn_x=None, size=48):
-        path = os.path.join(ASSET_DIR, "enemy.png")
-        img = pygame.image.load(path).convert_alpha()
-        self.image = pygame.transform.smoothscale(img, (size, size))
+    sprite = "enemy.png"  # 아틀라스 이름
+    seq = 0               # 스폰 순서 (Simulation 이 지정, 먼저 스폰된 적이 먼저 맞음)
+
+    def __init__(self, screen_width, spawn_x=None, size=48, rng=random, speed_range=(120, 240)):
+        self.image = assets.image("enemy.png", (size, size))
+        self.reset(screen_width, spawn_x, rng, speed_range)
 
+    # 풀에서 재사용될 때 위치/속도만 다시 정함
+    def reset(self, screen_width, spawn_x=None, rng=random, speed_range=(120, 240)):
         if spawn_x is None:
-            spawn_x = random.randint(50, max(50, screen_width - 50))
+            spawn_x = rng.randint(50, max(50, screen_width - 50))
 
         self.rect = self.image.get_rect(center=(spawn_x, -160))
-        self.speed = random.randint(120, 240)
+        # 실제 위치는 float 로 누적 (rect 는 반올림된 정수 좌표)
+        self.y = self.prev_y = float(self.rect.y)
+        self.speed = rng.randint(*speed_range)
 
     def update(self, dt):
-        self.rect.y += self.speed * dt
+        self.prev_y = self.y
+        self.y += self.speed * dt
+        self.rect.y = self.y
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+    # alpha: 이전 스텝과 현재 스텝 사이 보간 비율
+    def draw(self, screen, alpha=1.0):
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        screen.blit(self.image, (self.rect.x, round(y)))
 
     def collision_rect(self):
         return self.rect.inflate(-8, -8)
@@ -0,0 +1,144 @@
+import random
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy 가 없으면 기존 객체 방식만 사용
+    np = None
+
+# 엔티티 종류
+KIND_ENEMY = 0
+KIND_ITEM = 1
+KIND_HEAL = 2
+
+ENEMY_SIZE = 48
+ITEM_SIZE = 32
+
+
+def available():
+    return np is not None
+
+
+# pygame.Rect 에 float 를 넣을 때와 같은 반올림 (0.5 는 0 에서 먼 쪽)
+def _rect_round(v):
+    return np.sign(v) * np.floor(np.abs(v) + 0.5)
+
+
+# ✅ 구조체 배열(SoA) 방식의 낙하 엔티티 저장소
+class EntityStore:
+    def __init__(self, capacity=256):
+        if np is None:
+            raise RuntimeError("EntityStore 는 numpy 가 필요합니다")
+        self.capacity = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.prev_y = np.zeros(0)
+        self.w = np.zeros(0)
+        self.h = np.zeros(0)
+        self.speed = np.zeros(0)
+        self.value = np.zeros(0, dtype=np.int64)
+        self.kind = np.zeros(0, dtype=np.int8)
+        self.alive = np.zeros(0, dtype=bool)
+        self.seq = np.zeros(0, dtype=np.int64)  # 스폰 순서 (리스트 순서와 동일하게 처리하기 위함)
+        self._next_seq = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        extra = capacity - self.capacity
+        self.x = np.concatenate([self.x, np.zeros(extra)])
+        self.y = np.concatenate([self.y, np.zeros(extra)])
+        self.prev_y = np.concatenate([self.prev_y, np.zeros(extra)])
+        self.w = np.concatenate([self.w, np.zeros(extra)])
+        self.h = np.concatenate([self.h, np.zeros(extra)])
+        self.speed = np.concatenate([self.speed, np.zeros(extra)])
+        self.value = np.concatenate([self.value, np.zeros(extra, dtype=np.int64)])
+        self.kind = np.concatenate([self.kind, np.zeros(extra, dtype=np.int8)])
+        self.alive = np.concatenate([self.alive, np.zeros(extra, dtype=bool)])
+        self.seq = np.concatenate([self.seq, np.zeros(extra, dtype=np.int64)])
+        self.capacity = capacity
+
+    def _free_slot(self):
+        free = np.flatnonzero(~self.alive)
+        if len(free) == 0:
+            i = self.capacity
+            self._grow(self.capacity * 2)
+            return i
+        return free[0]
+
+    def spawn(self, kind, cx, cy, size, speed, value=0):
+        i = self._free_slot()
+        # Surface.get_rect(center=...) 와 같은 좌상단 계산
+        self.x[i] = cx - size // 2
+        self.y[i] = self.prev_y[i] = cy - size // 2
+        self.w[i] = size
+        self.h[i] = size
+        self.speed[i] = speed
+        self.value[i] = value
+        self.kind[i] = kind
+        self.alive[i] = True
+        self.seq[i] = self._next_seq
+        self._next_seq += 1
+        return i
+
+    # Enemy.reset 과 같은 순서로 난수를 뽑음
+    def spawn_enemy(self, screen_width, spawn_x=None, rng=random, speed_range=(120, 240)):
+        if spawn_x is None:
+            spawn_x = rng.randint(50, max(50, screen_width - 50))
+        return self.spawn(KIND_ENEMY, spawn_x, -160, ENEMY_SIZE, rng.randint(*speed_range))
+
+    # Item.reset 과 같은 순서로 난수를 뽑음
+    def spawn_item(self, screen_width, rng=random):
+        cx = rng.randint(40, max(40, screen_width - 40))
+        return self.spawn(KIND_ITEM, cx, -30, ITEM_SIZE, 150, value=5)
+
+    # 살아있고 종류가 kinds 중 하나인 슬롯 (종류가 몇 개뿐이라 np.isin 보다 빠름)
+    def _kind_mask(self, kinds):
+        m = self.kind == kinds[0]
+        for k in kinds[1:]:
+            m |= self.kind == k
+        return m & self.alive
+
+    def kill(self, idx):
+        self.alive[idx] = False
+
+    def clear(self):
+        self.alive[:] = False
+
+    # ✅ 전체 이동 + 화면 밖 정리를 한 번에 (위치는 float, 판정은 반올림된 정수 좌표)
+    def update(self, dt, height):
+        a = self.alive
+        self.prev_y[a] = self.y[a]
+        self.y[a] += self.speed[a] * dt
+        self.alive &= ~(_rect_round(self.y) > height)
+
+    # ✅ rect 와 겹치는 엔티티 인덱스 (스폰 순서대로) - pygame.Rect.colliderect 와 동일한 판정
+    def collide(self, rect, kinds):
+        m = self._kind_mask(kinds)
+        y = _rect_round(self.y)
+        m &= (self.x < rect.x + rect.w) & (self.x + self.w > rect.x)
+        m &= (y < rect.y + rect.h) & (y + self.h > rect.y)
+        idx = np.flatnonzero(m)
+        return idx[np.argsort(self.seq[idx], kind="stable")]
+
+    # 살아있는 엔티티 rect 목록 (스폰 순서, 객체 방식의 e.rect 와 같은 좌표)
+    def rects(self, kinds):
+        idx = np.flatnonzero(self._kind_mask(kinds))
+        idx = idx[np.argsort(self.seq[idx], kind="stable")]
+        cols = (self.x[idx], _rect_round(self.y[idx]), self.w[idx], self.h[idx])
+        return [pygame.Rect(*r) for r in zip(*(c.astype(int).tolist() for c in cols))]
+
+    def count(self, kinds):
+        return int(np.count_nonzero(self._kind_mask(kinds)))
+
+    def free_slots(self):
+        return int(self.capacity - np.count_nonzero(self.alive))
+
+    # ✅ Surface.blits 에 바로 넘길 (이미지, 좌표) 목록 (적 먼저, 그 다음 아이템)
+    def blit_list(self, images, alpha=1.0):
+        idx = np.flatnonzero(self.alive)
+        idx = idx[np.lexsort((self.seq[idx], self.kind[idx]))]
+        prev = self.prev_y[idx]
+        xs = self.x[idx].astype(int).tolist()
+        ys = np.round(prev + (self.y[idx] - prev) * alpha).astype(int).tolist()
+        ks = self.kind[idx].tolist()
+        return [(images[k], (x, y)) for k, x, y in zip(ks, xs, ys)]
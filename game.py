@@ -1,221 +1,248 @@
 import pygame
-from pygame.locals import QUIT, MOUSEBUTTONDOWN
-from player import Player
-from enemy import Enemy
-from item import Item
+from pygame.locals import QUIT, KEYDOWN, K_F11, VIDEORESIZE, RESIZABLE, FULLSCREEN
 from background import Background
-import random
+from renderer import Renderer
+from profiler import FrameProfiler, NullProfiler, StartupTimer, enabled_from_env
+from screens import PlayScreen, PAUSE_KEYS
+from asset_manager import assets, PRELOAD, DEFERRED
+from entity_store import KIND_ENEMY, KIND_ITEM, KIND_HEAL, ENEMY_SIZE, ITEM_SIZE
+from simulation import Simulation, SIM_DT
+from score_store import ScoreStore
+from player import KeyState, keys_to_mask
+from replay import Recorder, EXT as REPLAY_EXT
 import os
-import json
-import traceback
+import struct
+import time
+import threading
+import warnings
+
+RENDER_SCALE_ENV = "STAR_DRIFT_RENDER_SCALE"   # 내부 렌더 배율 (1.0 / 0.5 / auto)
+# 확대는 정확히 2배일 때만 빠르므로 0.75 같은 배율은 지원하지 않음 (창 해상도로 그리는 것보다 느림)
+RENDER_SCALES = (1.0, 0.5, "auto")
+
+
+def parse_render_scale(value):
+    if value == "auto":
+        return value
+    value = float(value)
+    if value not in RENDER_SCALES:
+        raise ValueError(f"render_scale must be one of {RENDER_SCALES}, got {value!r}")
+    return value
+
+
+# 환경 변수 값이 이상하면 경고 후 기본값 1.0
+def render_scale_from_env():
+    value = os.environ.get(RENDER_SCALE_ENV)
+    if not value:
+        return 1.0
+    try:
+        return parse_render_scale(value.strip().lower())
+    except ValueError:
+        warnings.warn(f"{RENDER_SCALE_ENV}={value!r} is not one of {RENDER_SCALES}; using 1.0")
+        return 1.0
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSET_DIR = os.path.join(BASE_DIR, "assets")
-HIGHSCORE_FILE = os.path.join(BASE_DIR, "highscore.json")
 
-class Game:
-    def __init__(self, width=800, height=600, debug=False):
+class Game(Simulation):
+    def __init__(self, width=800, height=600, debug=False, entity_backend="objects", seed=None, tuning=None,
+                 scroll_bg=True, record_dir=None, render_scale=None):
         self.debug = debug
 
-        pygame.init()
-        try:
-            pygame.mixer.init()
-        except:
-            pass
-
-        self.width = width
-        self.height = height
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        # 내부 렌더 해상도 = 창에 맞춘 게임 영역 x render_scale (게임 좌표는 항상 width x height)
+        #   "auto" 는 그리기가 느려지면 0.5 로, 여유가 생기면 1.0 으로 자동 전환
+        if render_scale is None:
+            render_scale = render_scale_from_env()
+        self.render_scale = parse_render_scale(render_scale)
+        self.window_size = (width, height)
+        self.fullscreen = False
+
+        # 입력 녹화 폴더 (STAR_DRIFT_RECORD 환경 변수로도 지정) / 재생 입력
+        self.record_dir = record_dir or os.environ.get("STAR_DRIFT_RECORD")
+        self.recorder = None
+        self.replay_input = None
+        self.startup = StartupTimer()
+
+        # 필요한 모듈만 초기화 (mixer 는 백그라운드에서)
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((width, height), RESIZABLE)
         pygame.display.set_caption("Star Drift")
         self.clock = pygame.time.Clock()
+        self.startup.mark("display")
 
-        # 생명(하트)
-        self.max_life = 3
-        self.life = 3
+        # 첫 화면에 필요한 이미지만 먼저 로드
+        assets.preload(PRELOAD + [("bg.png", (width, height), False)])
         try:
-            self.heart_img = pygame.image.load(os.path.join(ASSET_DIR, "heart.png")).convert_alpha()
-            self.heart_img = pygame.transform.smoothscale(self.heart_img, (32, 32))
+            self.heart_img = assets.image("heart.png", (32, 32))
         except:
             self.heart_img = None
+        self.startup.mark("critical_assets")
+
+        # 효과음/나머지 이미지는 첫 화면을 띄운 뒤 백그라운드에서
+        self.sfx_hit = self.sfx_pick = self.sfx_gameover = None
+        self.loader = threading.Thread(target=self.load_deferred, daemon=True)
+        self.loader.start()
+
+        # 게임 로직 (플레이어/적/아이템/타이머/점수)
+        super().__init__(width, height, entity_backend, seed, tuning)
+
+        self.bg = Background(self.screen, speed=50 if scroll_bg else 0)
+        if self.store is not None:
+            item_img = assets.image("item.png", (ITEM_SIZE, ITEM_SIZE))
+            self.store_images = {
+                KIND_ENEMY: assets.image("enemy.png", (ENEMY_SIZE, ENEMY_SIZE)),
+                KIND_ITEM: item_img,
+                KIND_HEAL: item_img,
+            }
+
+        # 폰트 (시스템 폰트 목록 검색 없이 pygame 기본 폰트 사용)
+        self.font = pygame.font.Font(None, 28)
+        self.title_font = pygame.font.Font(None, 48)
+        self.title_font.set_bold(True)
+        self.startup.mark("fonts")
+
+        self.scores = ScoreStore()
+        self.highscore = self.load_highscore()
+        self.renderer = Renderer(self)
+        self.menu_layers = {}
+        self.pause_requested = False
 
-        # 게임 오브젝트
-        self.bg = Background(self.screen)
-        self.player = Player(self.width // 2, self.height - 80)
-        self.enemies = []
-        self.items = []
-
-        # 타이머 및 점수
-        self.spawn_timer = -0.5
-        self.item_timer = 0.0
-        self.score = 0
-        self.invincible_time = 2.0
-        self.running = True
-
-        # 폰트
-        self.font = pygame.font.SysFont(None, 28)
-        self.title_font = pygame.font.SysFont(None, 48, bold=True)
+        # 프로파일러 (debug=True 또는 STAR_DRIFT_PROFILE=1)
+        self.profiler = FrameProfiler() if debug or enabled_from_env() else NullProfiler()
+        self.startup.mark("game_state")
 
-        # 효과음 (BGM 제거)
-        try:
-            self.sfx_hit = pygame.mixer.Sound(os.path.join(ASSET_DIR, "sfx_hit.wav"))
-        except:
-            self.sfx_hit = None
+    # ✅ 백그라운드 로딩: PNG 디코딩 + mixer 초기화 + 효과음 (BGM 제거)
+    def load_deferred(self):
+        assets.decode(DEFERRED)
         try:
-            self.sfx_pick = pygame.mixer.Sound(os.path.join(ASSET_DIR, "sfx_pick.wav"))
-        except:
-            self.sfx_pick = None
-        try:
-            self.sfx_gameover = pygame.mixer.Sound(os.path.join(ASSET_DIR, "sfx_gameover.wav"))
+            pygame.mixer.init()
         except:
-            self.sfx_gameover = None
-
-        self.highscore = self.load_highscore()
-
-    # ✅ 하이스코어 로드
-    def load_highscore(self):
-        if os.path.exists(HIGHSCORE_FILE):
+            pass
+        for attr, name in (("sfx_hit", "sfx_hit.wav"), ("sfx_pick", "sfx_pick.wav"),
+                           ("sfx_gameover", "sfx_gameover.wav")):
+            path = os.path.join(ASSET_DIR, name)
+            if not os.path.exists(path):
+                continue
             try:
-                with open(HIGHSCORE_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f).get("highscore", 0)
+                setattr(self, attr, pygame.mixer.Sound(path))
             except:
-                return 0
-        return 0
+                pass
+        self.startup.mark("deferred", background=True)
 
-    # ✅ 하이스코어 저장
+    # ✅ 하이스코어 (메모리 리더보드에서 바로)
+    def load_highscore(self):
+        return self.scores.highscore
+
+    # ✅ 이번 판 기록 (파일 쓰기는 ScoreStore 스레드에서)
     def save_highscore(self):
+        self.scores.record(self.score, duration=self.tick * SIM_DT, seed=self.seed)
+        self.highscore = self.scores.highscore
+
+    # ✅ 이번 판 입력 녹화 저장
+    def save_recording(self):
+        if self.recorder is None:
+            return
+        recording = self.recorder.finish()
+        self.recorder = None
         try:
-            with open(HIGHSCORE_FILE, "w", encoding="utf-8") as f:
-                json.dump({"highscore": max(self.highscore, self.score)}, f)
-        except:
+            os.makedirs(self.record_dir, exist_ok=True)
+            name = time.strftime("%Y%m%d-%H%M%S") + f"_{recording.seed}{REPLAY_EXT}"
+            recording.save(os.path.join(self.record_dir, name))
+        except (OSError, struct.error):
             pass
 
-    # 적 스폰
-    def spawn_enemy(self):
-        x = random.randint(50, self.width - 50)
-        self.enemies.append(Enemy(self.width, spawn_x=x))
-
-    # 아이템 스폰
-    def spawn_item(self):
-        self.items.append(Item(self.width))
-
     # 이벤트 처리
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == QUIT:
                 self.running = False
-
-    # ✅ 게임 업데이트
-    def update(self, dt):
-        if self.invincible_time > 0:
-            self.invincible_time -= dt
-
-        keys = pygame.key.get_pressed()
-        self.player.move(keys, dt, self.width, self.height)
-
-        self.spawn_timer += dt
-        if self.spawn_timer > 0.8:
-            self.spawn_enemy()
-            self.spawn_timer = 0
-
-        self.item_timer += dt
-        if self.item_timer > 4.0:
-            self.spawn_item()
-            self.item_timer = 0
-
-        # 충돌 처리
-        for e in self.enemies[:]:
-            e.update(dt)
-            if e.rect.colliderect(self.player.rect) and self.invincible_time <= 0:
-                if self.sfx_hit:
-                    self.sfx_hit.play()
-                self.life -= 1
-                self.invincible_time = 1.5
-                self.enemies.remove(e)
-                if self.life <= 0:
-                    self.running = False
-                    return
-
-        for it in self.items[:]:
-            it.update(dt)
-            if it.rect.colliderect(self.player.rect):
-                if self.sfx_pick:
-                    self.sfx_pick.play()
-                self.items.remove(it)
-                if getattr(it, "is_heal", False):
-                    if self.life < self.max_life:
-                        self.life += 1
-                else:
-                    self.score += it.value
-
-        self.bg.update(dt)
-
-    # ✅ 그리기
-    def draw(self):
-        self.screen.fill((0, 0, 0))
-        self.bg.draw()
-        for e in self.enemies:
-            e.draw(self.screen)
-        for it in self.items:
-            it.draw(self.screen)
-        self.player.draw(self.screen)
-
-        # 하트 UI
-        if self.heart_img:
-            for i in range(self.life):
-                self.screen.blit(self.heart_img, (10 + i * 36, 10))
-
-        self.screen.blit(self.font.render(f"Score: {self.score}", True, (255,255,255)), (10, 50))
-        self.screen.blit(self.font.render(f"High: {self.highscore}", True, (255,215,0)), (10, 75))
-
-    # ✅ 게임 오버
-    def game_over(self):
+            elif event.type == KEYDOWN and event.key in PAUSE_KEYS:
+                self.pause_requested = True
+            else:
+                self.handle_display_event(event)
+
+    # ✅ 창 크기 변경 / F11 전체화면 (재시작 없이 렌더 대상만 다시 만듦)
+    def handle_display_event(self, event):
+        if event.type == VIDEORESIZE and not self.fullscreen:
+            self.set_display(event.size)
+            return True
+        if event.type == KEYDOWN and event.key == K_F11:
+            self.set_display(fullscreen=not self.fullscreen)
+            return True
+        return False
+
+    def set_display(self, size=None, fullscreen=None):
+        if fullscreen is not None:
+            self.fullscreen = fullscreen
+        if self.fullscreen:
+            self.screen = pygame.display.set_mode((0, 0), FULLSCREEN)
+        else:
+            self.screen = pygame.display.set_mode(size or self.window_size, RESIZABLE)
+            self.window_size = self.screen.get_size()
+        self.menu_layers.clear()
+        self.renderer.rebuild()
+
+    # ✅ 한 판 시작 (녹화 중이면 새 녹화 시작)
+    def start_run(self, seed=None):
+        super().start_run(seed)
+        if self.record_dir:
+            self.recorder = Recorder(self)
+
+    # 키보드 입력 (재생 중이면 녹화된 입력) -> 이동 키 비트마스크로 통일
+    def read_keys(self):
+        if self.replay_input is not None:
+            mask = self.replay_input.next_mask()
+        else:
+            mask = keys_to_mask(pygame.key.get_pressed())
+        if self.recorder is not None:
+            self.recorder.capture(mask)
+        return KeyState.from_mask(mask)
+
+    # 효과음
+    def on_event(self, name):
+        sfx = {"hit": self.sfx_hit, "pick": self.sfx_pick}.get(name)
+        if sfx:
+            sfx.play()
+
+    # ✅ 게임 업데이트 (로직 + 배경 스크롤)
+    def update(self, dt, keys=None):
+        super().update(dt, keys)
+        if self.running:
+            self.bg.update(dt)
+
+    # ✅ 그리기 (alpha: 시뮬레이션 스텝 사이 보간 비율)
+    def draw(self, alpha=1.0):
+        self.renderer.draw(alpha)
+
+    # ✅ 게임 오버 진입 시 한 번
+    def on_game_over(self):
         if self.sfx_gameover:
             self.sfx_gameover.play()
+        if self.replay_input is not None:
+            return
         self.save_highscore()
-
-        restart = pygame.Rect(300, 350, 100, 40)
-        quit_btn = pygame.Rect(420, 350, 100, 40)
-
-        while True:
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    pygame.quit()
-                    exit()
-                if event.type == MOUSEBUTTONDOWN:
-                    if restart.collidepoint(event.pos):
-                        self.reset_game()
-                        return
-                    if quit_btn.collidepoint(event.pos):
-                        pygame.quit()
-                        exit()
-
-            self.screen.fill((0,0,0))
-            txt = self.title_font.render("THE FORCE WAS NOT WITH YOU", True, (255,0,0))
-            self.screen.blit(txt, (self.width//2 - txt.get_width()//2, 200))
-
-            pygame.draw.rect(self.screen, (70,70,200), restart)
-            pygame.draw.rect(self.screen, (200,70,70), quit_btn)
-            self.screen.blit(self.font.render("Restart", True, (255,255,255)), (restart.x+10, restart.y+10))
-            self.screen.blit(self.font.render("Quit", True, (255,255,255)), (quit_btn.x+25, quit_btn.y+10))
-
-            pygame.display.flip()
-
-    # ✅ 게임 리셋
-    def reset_game(self):
-        self.enemies.clear()
-        self.items.clear()
-        self.score = 0
-        self.life = self.max_life
-        self.running = True
-
-    # ✅ ⭐⭐⭐ run() 이 Game 클래스 안에 제대로 들어가 있음 ⭐⭐⭐
+        self.save_recording()
+        self.profiler.dump()
+        if self.debug:
+            print("asset cache:", assets.stats())
+            print("frame stats:", self.profiler.summary())
+
+    # 메뉴 화면용 미리 렌더한 surface (한 번 만들고 재사용)
+    def menu_layer(self, name, build):
+        layer = self.menu_layers.get(name)
+        if layer is None:
+            layer = self.menu_layers[name] = build()
+        return layer
+
+    # ✅ 첫 프레임이 화면에 나간 시점 기록
+    def on_first_frame(self):
+        self.startup.mark("first_frame")
+        if self.debug:
+            print(self.startup.report())
+
+    # ✅ 화면 상태 전환 루프 (플레이 / 일시정지 / 게임 오버)
     def run(self):
+        screen = PlayScreen(self)
         while True:
-            while self.running:
-                dt = self.clock.tick(60) / 1000
-                self.handle_events()
-                self.update(dt)
-                self.draw()
-                pygame.display.flip()
-
-            self.game_over()
+            screen = screen.step()
@@ -0,0 +1,189 @@
+# 화면/사운드 없이 Game 로직만 대량으로 돌려서 밸런스 통계를 뽑는 실행 파일
+#   python headless.py --episodes 2000 --policy random --enemy-interval 0.7
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+from player import KeyState
+from simulation import Simulation, SIM_HZ, SIM_DT
+from profiler import percentile
+from entity_store import KIND_ENEMY
+
+IDLE = KeyState()
+LEFT = KeyState([pygame.K_LEFT])
+RIGHT = KeyState([pygame.K_RIGHT])
+
+
+# ✅ 입력 정책: 시뮬레이션을 보고 이번 스텝에 누를 키를 정함
+class IdlePolicy:
+    def __init__(self, seed):
+        pass
+
+    def keys(self, sim):
+        return IDLE
+
+
+class RandomPolicy:
+    def __init__(self, seed, hold=(0.2, 1.0)):
+        self.rng = random.Random(seed ^ 0x5EED)
+        self.hold = hold
+        self.current = IDLE
+        self.until = 0
+
+    def keys(self, sim):
+        if sim.tick >= self.until:
+            self.current = self.rng.choice((IDLE, LEFT, RIGHT))
+            self.until = sim.tick + int(self.rng.uniform(*self.hold) * SIM_HZ)
+        return self.current
+
+
+class DodgePolicy:
+    # 플레이어 위쪽에서 가장 가까운 적의 반대쪽으로 피함
+    def __init__(self, seed):
+        pass
+
+    def keys(self, sim):
+        p = sim.player.rect
+        if sim.store is not None:
+            enemies = sim.store.rects((KIND_ENEMY,))
+        else:
+            enemies = [e.rect for e in sim.enemies]
+        danger = [r for r in enemies if r.bottom < p.bottom and abs(r.centerx - p.centerx) < 80]
+        if not danger:
+            return IDLE
+        e = max(danger, key=lambda r: r.bottom)
+        if e.centerx >= p.centerx:
+            return LEFT if p.left > 0 else RIGHT
+        return RIGHT if p.right < sim.width else LEFT
+
+
+POLICIES = {"idle": IdlePolicy, "random": RandomPolicy, "dodge": DodgePolicy}
+
+
+# 피격 횟수를 세는 시뮬레이션
+class CountingSimulation(Simulation):
+    def __init__(self, *args, **kwargs):
+        self.hits = 0
+        self.picks = 0
+        super().__init__(*args, **kwargs)
+
+    def on_event(self, name):
+        if name == "hit":
+            self.hits += 1
+        elif name == "pick":
+            self.picks += 1
+
+
+# ✅ 에피소드 하나 (clock.tick 없이 CPU 가 허용하는 만큼 빠르게)
+def run_episode(seed, policy="random", max_seconds=300.0, tuning=None, entity_backend="objects"):
+    sim = CountingSimulation(seed=seed, tuning=tuning, entity_backend=entity_backend)
+    agent = POLICIES[policy](seed)
+    max_ticks = int(max_seconds * SIM_HZ)
+    while sim.running and sim.tick < max_ticks:
+        sim.update(SIM_DT, agent.keys(sim))
+    return {
+        "seed": seed,
+        "survival": sim.tick * SIM_DT,
+        "score": sim.score,
+        "hits": sim.hits,
+        "picks": sim.picks,
+        "died": not sim.running,
+    }
+
+
+def _run_episode_args(args):
+    return run_episode(*args)
+
+
+# ✅ 통계 집계
+def summarize(results):
+    survival = [r["survival"] for r in results]
+    scores = [r["score"] for r in results]
+    total_minutes = sum(survival) / 60
+    return {
+        "episodes": len(results),
+        "deaths": sum(r["died"] for r in results),
+        "survival": {
+            "mean": statistics.fmean(survival),
+            "p10": percentile(survival, 0.10),
+            "p50": percentile(survival, 0.50),
+            "p90": percentile(survival, 0.90),
+            "max": max(survival),
+        },
+        "score": {
+            "mean": statistics.fmean(scores),
+            "stdev": statistics.pstdev(scores),
+            "p10": percentile(scores, 0.10),
+            "p50": percentile(scores, 0.50),
+            "p90": percentile(scores, 0.90),
+            "max": max(scores),
+        },
+        "hits_per_minute": sum(r["hits"] for r in results) / total_minutes if total_minutes else 0.0,
+        "picks_per_minute": sum(r["picks"] for r in results) / total_minutes if total_minutes else 0.0,
+    }
+
+
+# ✅ 여러 시드를 프로세스 풀에 나눠서 실행
+def run_batch(episodes, seed=0, policy="random", max_seconds=300.0, tuning=None,
+              entity_backend="objects", workers=None):
+    jobs = [(seed + i, policy, max_seconds, tuning, entity_backend) for i in range(episodes)]
+    if workers == 1:
+        return [_run_episode_args(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunk = max(1, episodes // ((workers or os.cpu_count() or 1) * 4))
+        return list(pool.map(_run_episode_args, jobs, chunksize=chunk))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Star Drift headless batch simulation")
+    parser.add_argument("--episodes", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--seed", type=int, default=0, help="첫 에피소드 시드 (이후 +1 씩)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--max-seconds", type=float, default=300.0)
+    parser.add_argument("--backend", choices=("objects", "numpy"), default="objects")
+    parser.add_argument("--enemy-interval", type=float)
+    parser.add_argument("--item-interval", type=float)
+    parser.add_argument("--enemy-speed", type=int, nargs=2, metavar=("MIN", "MAX"))
+    parser.add_argument("--start-invincible", type=float)
+    parser.add_argument("--hit-invincible", type=float)
+    parser.add_argument("--json", action="store_true", help="통계를 JSON 으로 출력")
+    args = parser.parse_args()
+
+    tuning = {}
+    for key in ("enemy_interval", "item_interval", "start_invincible", "hit_invincible"):
+        if getattr(args, key) is not None:
+            tuning[key] = getattr(args, key)
+    if args.enemy_speed:
+        tuning["enemy_speed"] = tuple(args.enemy_speed)
+
+    start = time.perf_counter()
+    results = run_batch(args.episodes, args.seed, args.policy, args.max_seconds, tuning,
+                        args.backend, args.workers)
+    elapsed = time.perf_counter() - start
+    stats = summarize(results)
+    stats["tuning"] = tuning
+    stats["wall_seconds"] = elapsed
+
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return
+
+    s, sc = stats["survival"], stats["score"]
+    print(f"{stats['episodes']} episodes ({args.policy}) in {elapsed:.1f}s, deaths {stats['deaths']}")
+    print(f"survival  mean {s['mean']:.1f}s  p10 {s['p10']:.1f}  p50 {s['p50']:.1f}  p90 {s['p90']:.1f}  max {s['max']:.1f}")
+    print(f"score     mean {sc['mean']:.1f}  sd {sc['stdev']:.1f}  p10 {sc['p10']:.0f}  p50 {sc['p50']:.0f}  p90 {sc['p90']:.0f}  max {sc['max']}")
+    print(f"hits/min  {stats['hits_per_minute']:.2f}   picks/min {stats['picks_per_minute']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,29 @@
-import os
-import pygame
 import random
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-ASSET_DIR = os.path.join(BASE_DIR, "assets")
+from asset_manager import assets
 
 class Item:
-    def __init__(self, screen_width, size=32):
-        path = os.path.join(ASSET_DIR, "item.png")
-        img = pygame.image.load(path).convert_alpha()
-        self.image = pygame.transform.smoothscale(img, (size, size))
-        self.rect = self.image.get_rect(center=(random.randint(40, max(40, screen_width - 40)), -30))
+    sprite = "item.png"  # 아틀라스 이름
+
+    def __init__(self, screen_width, size=32, rng=random):
+        self.image = assets.image("item.png", (size, size))
+        self.reset(screen_width, rng)
+
+    # 풀에서 재사용될 때 위치/속성만 다시 정함
+    def reset(self, screen_width, rng=random):
+        self.rect = self.image.get_rect(center=(rng.randint(40, max(40, screen_width - 40)), -30))
+        self.y = self.prev_y = float(self.rect.y)
         self.speed = 150
         self.value = 5
         self.is_heal = False
 
     def update(self, dt):
-        self.rect.y += self.speed * dt
+        self.prev_y = self.y
+        self.y += self.speed * dt
+        self.rect.y = self.y
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        screen.blit(self.image, (self.rect.x, round(y)))
 
     def collision_rect(self):
         return self.rect.inflate(-8, -8)
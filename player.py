@@ -1,16 +1,49 @@
 import pygame
-import os
+from asset_manager import assets
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-ASSET_DIR = os.path.join(BASE_DIR, "assets")
+# Player.move 가 읽는 키
+MOVE_KEYS = (pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d,
+             pygame.K_UP, pygame.K_w, pygame.K_DOWN, pygame.K_s)
+
+
+# pygame.key.get_pressed() 대신 쓸 수 있는 입력 (스크립트/헤드리스/재생용)
+class KeyState:
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    # MOVE_KEYS 비트마스크 -> KeyState (256가지뿐이라 처음 쓸 때 만들어 재사용)
+    @staticmethod
+    def from_mask(mask):
+        state = _MASK_STATES.get(mask)
+        if state is None:
+            state = _MASK_STATES[mask] = KeyState(k for bit, k in enumerate(MOVE_KEYS) if mask & (1 << bit))
+        return state
+
+
+# 눌린 이동 키 -> 1바이트 비트마스크 (MOVE_KEYS 순서)
+def keys_to_mask(keys):
+    mask = 0
+    for bit, key in enumerate(MOVE_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+_MASK_STATES = {}
 
 class Player:
+    sprite = "kirby.png"  # 아틀라스 이름
+
     def __init__(self, x, y, size=70):
-        path = os.path.join(ASSET_DIR, "kirby.png")
-        img = pygame.image.load(path).convert_alpha()
-        self.image = pygame.transform.smoothscale(img, (size, size))
+        self.image = assets.image("kirby.png", (size, size))
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = 300
+        # 실제 위치는 float 로 누적 (rect 는 반올림된 정수 좌표)
+        self.x = self.prev_x = float(self.rect.x)
+        self.y = self.prev_y = float(self.rect.y)
 
     def move(self, keys, dt, screen_w, screen_h):
         dx = dy = 0
@@ -23,12 +56,17 @@ class Player:
         if keys[pygame.K_DOWN] or keys[pygame.K_s]:
             dy += 1
 
-        self.rect.x += dx * self.speed * dt
-        self.rect.y += dy * self.speed * dt
-        self.rect.clamp_ip(pygame.Rect(0, 0, screen_w, screen_h))
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x = min(max(self.x + dx * self.speed * dt, 0.0), float(screen_w - self.rect.w))
+        self.y = min(max(self.y + dy * self.speed * dt, 0.0), float(screen_h - self.rect.h))
+        self.rect.x = self.x
+        self.rect.y = self.y
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+    # alpha: 이전 스텝과 현재 스텝 사이 보간 비율
+    def draw(self, screen, alpha=1.0):
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        screen.blit(self.image, (round(x), round(y)))
 
     def collision_rect(self):
         return self.rect.inflate(-20, -20)
@@ -0,0 +1,31 @@
+# 엔티티 재사용 풀 (화면 밖으로 나간 객체를 다시 씀)
+class EntityPool:
+    def __init__(self, factory, max_size=256):
+        self.factory = factory
+        self.max_size = max_size
+        self._free = []
+        self.created = 0
+        self.reused = 0
+
+    # ✅ 꺼내기: 남는 객체가 있으면 reset 해서 재사용
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args, **kwargs)
+
+    # ✅ 반납
+    def release(self, obj):
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+
+    def release_all(self, objs):
+        for obj in objs:
+            self.release(obj)
+
+    @property
+    def pooled(self):
+        return len(self._free)
@@ -0,0 +1,220 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+import pygame
+
+PROFILE_ENV = "STAR_DRIFT_PROFILE"   # 1 이면 프로파일러 켜기
+TRACE_ENV = "STAR_DRIFT_TRACE"       # 세션 종료 시 trace 저장 경로 (.csv / .json)
+
+PHASES = ("events", "update", "draw", "present")
+TRACE_FIELDS = ("frame", "frame_ms") + tuple(f"{name}_ms" for name in PHASES) + (
+    "entities", "spawns", "collision_checks")
+GRAPH_W, GRAPH_H = 180, 48
+
+
+def enabled_from_env():
+    return os.environ.get(PROFILE_ENV, "") not in ("", "0")
+
+
+# 선형 보간 백분위 (profiler / headless 공용)
+def percentile(values, q):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = (len(values) - 1) * q
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+# ✅ 시작 단계별 소요 시간 (ms)
+#   백그라운드 로더 스레드도 mark 하므로 stages 는 잠금 안에서만 읽고 씀
+class StartupTimer:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    # 이전 단계 이후 걸린 시간 기록 (background=True 면 시작부터의 시간)
+    def mark(self, name, background=False):
+        now = time.perf_counter()
+        with self._lock:
+            self.stages[name] = (now - (self.start if background else self.last)) * 1000
+            if not background:
+                self.last = now
+
+    def has(self, name):
+        with self._lock:
+            return name in self.stages
+
+    def total_ms(self):
+        return (self.last - self.start) * 1000
+
+    def report(self):
+        with self._lock:
+            parts = [f"{name} {ms:.1f}ms" for name, ms in self.stages.items()]
+        return f"startup {self.total_ms():.1f}ms: " + ", ".join(parts)
+
+
+class _Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler._phase_ms[self.name] += (time.perf_counter() - self.start) * 1000
+
+
+# 꺼져 있을 때 쓰는 빈 프로파일러 (호출 비용 최소화)
+class NullProfiler:
+    enabled = False
+
+    class _Nothing:
+        def __enter__(self):
+            pass
+
+        def __exit__(self, *exc):
+            pass
+
+    _nothing = _Nothing()
+
+    def begin_frame(self):
+        pass
+
+    def resume(self):
+        pass
+
+    def phase(self, name):
+        return self._nothing
+
+    def end_frame(self, game):
+        pass
+
+    def draw_overlay(self, screen):
+        pass
+
+    def summary(self):
+        return {}
+
+    def dump(self, path=None):
+        pass
+
+
+# ✅ 프레임 단계별 시간 + 엔티티/스폰/충돌 검사 수 측정
+class FrameProfiler:
+    enabled = True
+
+    # trace 는 저장 경로가 있을 때만, 최근 max_trace 프레임(60fps 로 10분)을 튜플로 보관
+    def __init__(self, window=600, hitch_ms=1000 / 30, trace_path=None, max_trace=36000):
+        self.window = deque(maxlen=window)   # 최근 프레임 시간(ms)
+        self.hitch_ms = hitch_ms
+        self.trace_path = trace_path if trace_path is not None else os.environ.get(TRACE_ENV)
+        self.trace = deque(maxlen=max_trace if self.trace_path else 0)
+        self._entities = 0
+        self.frame = 0
+        self.hitches = 0
+        self._last = None
+        self._phase_ms = dict.fromkeys(PHASES, 0.0)
+        self._phases = {name: _Phase(self, name) for name in PHASES}
+        self._prev_counters = (0, 0)
+        self._summary = {}
+        self._text = None
+        self._font = None
+
+    # 일시정지/게임 오버 화면에서 보낸 시간이 한 프레임으로 잡히지 않게
+    def resume(self):
+        self._last = None
+
+    def begin_frame(self):
+        for name in self._phase_ms:
+            self._phase_ms[name] = 0.0
+
+    def phase(self, name):
+        return self._phases[name]
+
+    def end_frame(self, game):
+        now = time.perf_counter()
+        frame_ms = (now - self._last) * 1000 if self._last is not None else 0.0
+        self.frame += 1
+        # 시작/재개 직후 프레임은 기준 시각이 없으므로 통계에서 제외
+        if self._last is not None:
+            if frame_ms > self.hitch_ms:
+                self.hitches += 1
+            self.window.append(frame_ms)
+        self._last = now
+
+        counts = game.entity_counts()
+        spawns, checks = game.spawn_count, game.collision_checks
+        prev_spawns, prev_checks = self._prev_counters
+        self._prev_counters = (spawns, checks)
+        self._entities = counts["enemies"] + counts["items"]
+        self.trace.append((self.frame, round(frame_ms, 3)) +
+                          tuple(round(self._phase_ms[name], 3) for name in PHASES) +
+                          (self._entities, spawns - prev_spawns, checks - prev_checks))
+
+        # 통계/오버레이 글자는 30 프레임마다만 갱신
+        if self.frame % 30 == 0:
+            self._summary = self.summary()
+            self._text = None
+
+    # ✅ 최근 구간 p50/p95/p99 + 끊김 횟수
+    def summary(self):
+        frames = list(self.window)
+        return {
+            "frames": self.frame,
+            "p50_ms": percentile(frames, 0.50),
+            "p95_ms": percentile(frames, 0.95),
+            "p99_ms": percentile(frames, 0.99),
+            "hitches": self.hitches,
+            "window_hitches": sum(1 for f in frames if f > self.hitch_ms),
+            "entities": self._entities,
+        }
+
+    # ✅ 화면 오른쪽 위 작은 그래프 + 수치
+    def draw_overlay(self, screen):
+        x0 = screen.get_width() - GRAPH_W - 10
+        panel = pygame.Rect(x0, 10, GRAPH_W, GRAPH_H + 40)
+        screen.fill((0, 0, 0), panel)
+
+        # 16.7ms(60fps) 기준선과 최근 프레임 시간 그래프
+        base = 10 + GRAPH_H
+        scale = GRAPH_H / (self.hitch_ms * 1.5)
+        pygame.draw.line(screen, (60, 120, 60), (x0, base - 16.7 * scale), (x0 + GRAPH_W, base - 16.7 * scale))
+        recent = list(self.window)[-GRAPH_W:]
+        for i, ms in enumerate(recent):
+            color = (230, 80, 80) if ms > self.hitch_ms else (120, 200, 255)
+            top = base - min(ms * scale, GRAPH_H)
+            pygame.draw.line(screen, color, (x0 + i, base), (x0 + i, top))
+
+        if self._text is None and self._summary:
+            if self._font is None:
+                self._font = pygame.font.Font(None, 18)
+            s = self._summary
+            lines = [
+                f"p50 {s['p50_ms']:.1f} p95 {s['p95_ms']:.1f} p99 {s['p99_ms']:.1f}",
+                f"hitch {s['window_hitches']}/{s['hitches']}  ent {s['entities']}",
+            ]
+            self._text = [self._font.render(t, True, (255,255,255)) for t in lines]
+        for i, surf in enumerate(self._text or ()):
+            screen.blit(surf, (x0 + 2, base + 4 + i * 16))
+
+    # ✅ trace 저장 (.json 이면 JSON, 그 외 CSV)
+    def dump(self, path=None):
+        path = path or self.trace_path
+        if not path or not self.trace:
+            return
+        if path.endswith(".json"):
+            rows = [dict(zip(TRACE_FIELDS, row)) for row in self.trace]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"summary": self.summary(), "frames": rows}, f)
+        else:
+            import csv
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(TRACE_FIELDS)
+                writer.writerows(self.trace)
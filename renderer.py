@@ -0,0 +1,208 @@
+import time
+import pygame
+from atlas import SpriteAtlas
+from asset_manager import PRELOAD, DEFERRED
+from entity_store import KIND_ENEMY, KIND_ITEM, KIND_HEAL
+
+HUD_POS = (10, 10)
+ATLAS_SPRITES = [(name, size) for name, size, _ in PRELOAD + DEFERRED]
+STORE_SPRITES = {KIND_ENEMY: "enemy.png", KIND_ITEM: "item.png", KIND_HEAL: "item.png"}
+
+# render_scale="auto": 그리기+반영 시간이 예산을 넘으면 절반 해상도로, 충분히 여유가 생기면 다시 원래대로
+AUTO_BUDGET_MS = 10.0    # 60fps 프레임(16.7ms) 중 그리기에 쓸 몫
+AUTO_RESTORE = 0.35      # 절반 해상도에서 이 비율 아래로 내려가면 원래 해상도로
+AUTO_COOLDOWN = 120      # 전환 뒤 최소 프레임 수 (깜빡임 방지)
+
+
+# ✅ 게임 화면 그리기 (HUD 캐시 + 스프라이트 일괄 blit + 더티 렉트 갱신)
+#   창 크기가 게임 좌표(800x600)와 다르면 비율을 유지해 창 가운데(view)에 아틀라스로 그림 (남는 곳은 검은 띠)
+#   렌더 배율 0.5 면 절반 해상도 surface 에 그린 뒤 정확히 2배로 한 번만 확대
+class Renderer:
+    def __init__(self, game):
+        self.game = game
+        self.auto = game.render_scale == "auto"
+        self.level = 1.0 if self.auto else game.render_scale   # 지금 쓰는 배율
+        self.draw_ms = 0.0      # 그리기+반영 시간 (지수 이동 평균)
+        self._cooldown = AUTO_COOLDOWN
+        self._draw_start = None
+        self._hud = None
+        self._hud_key = None
+        self._hud_rect = pygame.Rect(HUD_POS, (0, 0))
+        self._prev_rects = []
+        self._dirty = None   # None 이면 전체 화면 flip
+        self._full = True    # 다음 프레임은 전체 다시 그리기
+        self.hud_renders = 0
+        self.rebuild()
+
+    # ✅ 창 크기/전체화면/렌더 배율이 바뀌면 내부 surface, 아틀라스, 배경 다시 만들기
+    def rebuild(self):
+        g = self.game
+        self.screen = g.screen
+        dw, dh = self.screen.get_size()
+
+        # 가로/세로 같은 배율로 창에 맞춤 (절반 해상도면 2배 확대가 정확하도록 짝수 크기)
+        scale = min(dw / g.width, dh / g.height)
+        half = self.level < 1
+        gw, gh = max(1, round(g.width * scale)), max(1, round(g.height * scale))
+        if half:
+            gw, gh = max(2, gw - gw % 2), max(2, gh - gh % 2)
+        self.view = pygame.Rect((dw - gw) // 2, (dh - gh) // 2, gw, gh)
+
+        if half:
+            self.target = pygame.Surface((gw // 2, gh // 2)).convert()
+            self._upscaled = self.screen.subsurface(self.view)
+        elif self.view.size == (dw, dh):
+            self.target = self.screen
+            self._upscaled = None
+        else:
+            self.target = self.screen.subsurface(self.view)
+            self._upscaled = None
+        tw, th = self.target.get_size()
+        self.sx, self.sy = tw / g.width, th / g.height
+
+        # 게임 좌표 그대로면 기존 경로 (개별 스프라이트 + 더티 렉트)
+        if self.target is self.screen and (tw, th) == (g.width, g.height):
+            self.atlas = None
+        else:
+            sprite_scale = tw / g.width
+            self.atlas = SpriteAtlas(ATLAS_SPRITES, (sprite_scale, sprite_scale))
+        g.bg.resize(self.target)
+        self._prev_rects = []
+        self.invalidate()
+
+    # 게임 오버 화면 등으로 화면이 덮였을 때 호출
+    def invalidate(self):
+        self._full = True
+
+    # ✅ 하트 + 점수 HUD (생명/점수/최고점수가 바뀔 때만 다시 렌더)
+    def _update_hud(self):
+        g = self.game
+        key = (g.life, g.score, g.highscore)
+        if key == self._hud_key:
+            return False
+        self._hud_key = key
+        self.hud_renders += 1
+
+        score = g.font.render(f"Score: {g.score}", True, (255,255,255))
+        high = g.font.render(f"High: {g.highscore}", True, (255,215,0))
+        hearts_w = 36 * g.max_life
+        w = max(hearts_w, score.get_width(), high.get_width())
+        h = 65 + high.get_height()
+        hud = pygame.Surface((w, h), pygame.SRCALPHA)
+        if g.heart_img:
+            for i in range(g.life):
+                hud.blit(g.heart_img, (i * 36, 0))
+        hud.blit(score, (0, 40))
+        hud.blit(high, (0, 65))
+        self._hud = hud
+        return True
+
+    # 스프라이트 (이미지, 좌표) 목록 - 적, 아이템, 플레이어 순서
+    #   아틀라스 사용 시 (아틀라스, 내부 해상도 좌표, 영역)
+    def _sprite_blits(self, alpha):
+        g = self.game
+        scaled = self.atlas is not None
+        blits = []
+        if g.store is not None:
+            blits.extend(g.store.blit_list(STORE_SPRITES if scaled else g.store_images, alpha))
+        for e in g.enemies:
+            blits.append((e.sprite if scaled else e.image,
+                          (e.rect.x, round(e.prev_y + (e.y - e.prev_y) * alpha))))
+        for it in g.items:
+            blits.append((it.sprite if scaled else it.image,
+                          (it.rect.x, round(it.prev_y + (it.y - it.prev_y) * alpha))))
+        p = g.player
+        blits.append((p.sprite if scaled else p.image,
+                      (round(p.prev_x + (p.x - p.prev_x) * alpha),
+                       round(p.prev_y + (p.y - p.prev_y) * alpha))))
+        if scaled:
+            sx, sy, blit = self.sx, self.sy, self.atlas.blit_args
+            blits = [blit(name, (round(x * sx), round(y * sy))) for name, (x, y) in blits]
+        return blits
+
+    # 정적 배경 일부만 복원
+    def _restore(self, rect):
+        self.screen.set_clip(rect)
+        self.game.bg.draw()
+        self.screen.set_clip(None)
+
+    # ✅ 내부 해상도로 그린 뒤 한 번에 확대, HUD 는 화면 해상도로
+    def _draw_scaled(self, alpha):
+        g = self.game
+        target = self.target
+        self._update_hud()
+        # 레터박스 띠는 메뉴 등으로 덮인 뒤에만 다시 칠함
+        full = self._full and self.view != self.screen.get_rect()
+        if full:
+            self.screen.fill((0, 0, 0))
+        if not g.bg.covers(target):
+            target.fill((0, 0, 0))
+        g.bg.draw(alpha)
+        target.blits(self._sprite_blits(alpha), doreturn=False)
+        if self._upscaled is not None:
+            pygame.transform.scale(target, self.view.size, self._upscaled)
+        self.screen.blit(self._hud, (self.view.x + HUD_POS[0], self.view.y + HUD_POS[1]))
+        self._dirty = None if full or self.view == self.screen.get_rect() else [self.view]
+        self._full = False
+
+    def draw(self, alpha=1.0):
+        self._draw_start = time.perf_counter()
+        if self.atlas is not None:
+            self._draw_scaled(alpha)
+            return
+        g = self.game
+        screen = self.screen
+        hud_changed = self._update_hud()
+        old_hud = self._hud_rect
+        self._hud_rect = self._hud.get_rect(topleft=HUD_POS)
+        blits = self._sprite_blits(alpha)
+
+        # 배경이 스크롤되면 화면 전체가 바뀌므로 전체 그리기
+        if self._full or g.bg.speed:
+            if not g.bg.covers(screen):
+                screen.fill((0, 0, 0))
+            g.bg.draw(alpha)
+            self._prev_rects = screen.blits(blits)
+            screen.blit(self._hud, HUD_POS)
+            self._dirty = None
+            self._full = False
+            return
+
+        # 정적 배경: 이전 스프라이트 자리만 지우고 새로 그린 영역만 갱신
+        dirty = list(self._prev_rects)
+        for r in self._prev_rects:
+            self._restore(r)
+        if hud_changed:
+            self._restore(old_hud.union(self._hud_rect))
+            dirty.append(old_hud.union(self._hud_rect))
+        rects = screen.blits(blits)
+        dirty.extend(rects)
+        if hud_changed or self._hud_rect.collidelist(dirty) != -1:
+            screen.blit(self._hud, HUD_POS)
+            dirty.append(self._hud_rect)
+        self._prev_rects = rects
+        self._dirty = dirty
+
+    # ✅ 화면에 반영 (전체 flip 또는 더티 렉트만 update)
+    def present(self):
+        if self._dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty)
+        if self.auto and self._draw_start is not None:
+            self._adapt((time.perf_counter() - self._draw_start) * 1000)
+
+    # ✅ 자동 배율: 그리기 비용을 보고 절반 해상도로 내리거나 다시 올림
+    def _adapt(self, ms):
+        self.draw_ms += (ms - self.draw_ms) * 0.1
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return
+        if self.level == 1.0 and self.draw_ms > AUTO_BUDGET_MS:
+            self.level = 0.5
+        elif self.level < 1 and self.draw_ms < AUTO_BUDGET_MS * AUTO_RESTORE:
+            self.level = 1.0
+        else:
+            return
+        self._cooldown = AUTO_COOLDOWN
+        self.rebuild()
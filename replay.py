@@ -0,0 +1,172 @@
+# 입력 녹화 파일(.sdr) 재생 / 검증
+#   python replay.py recordings/            # 폴더 안 모든 녹화를 헤드리스 최고 속도로 검증
+#   python replay.py run.sdr --render       # 실제 속도로 화면에 재생
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+
+from player import KeyState
+from simulation import Simulation, SIM_DT
+
+MAGIC = b"SDRP"
+VERSION = 1
+EXT = ".sdr"
+# magic, version, backend, seed, width, height, ticks, score, life, state hash, tuning 길이
+HEADER = struct.Struct("<4sBBQHHIiB20sH")
+BACKENDS = ("objects", "numpy")
+
+
+# ✅ 녹화 한 판: 시드 + 스텝별 입력 비트마스크 + 마지막 결과
+class Recording:
+    def __init__(self, seed, width=800, height=600, entity_backend="objects", tuning=None,
+                 masks=b"", score=0, life=0, state_hash=""):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.entity_backend = entity_backend
+        self.tuning = tuning or {}
+        self.masks = bytes(masks)
+        self.score = score
+        self.life = life
+        self.state_hash = state_hash
+
+    @property
+    def ticks(self):
+        return len(self.masks)
+
+    def save(self, path):
+        tuning = json.dumps(self.tuning).encode("utf-8")
+        header = HEADER.pack(MAGIC, VERSION, BACKENDS.index(self.entity_backend), self.seed,
+                             self.width, self.height, self.ticks, self.score, self.life,
+                             bytes.fromhex(self.state_hash), len(tuning))
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(header + tuning + zlib.compress(self.masks, 9))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        (magic, version, backend, seed, width, height, ticks, score, life,
+         digest, tuning_len) = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a Star Drift recording")
+        pos = HEADER.size
+        tuning = json.loads(data[pos:pos + tuning_len] or b"{}")
+        if "enemy_speed" in tuning:
+            tuning["enemy_speed"] = tuple(tuning["enemy_speed"])
+        masks = zlib.decompress(data[pos + tuning_len:])
+        if len(masks) != ticks:
+            raise ValueError(f"{path}: truncated input stream")
+        return cls(seed, width, height, BACKENDS[backend], tuning, masks, score, life, digest.hex())
+
+
+# ✅ 녹화기: Game 이 스텝마다 입력 마스크를 넘겨줌
+class Recorder:
+    def __init__(self, sim):
+        self.sim = sim
+        self.seed = sim.seed
+        self.masks = bytearray()
+
+    def capture(self, mask):
+        self.masks.append(mask)
+
+    def finish(self):
+        sim = self.sim
+        return Recording(self.seed, sim.width, sim.height, sim.entity_backend, sim.tuning,
+                         self.masks, sim.score, sim.life, sim.state_hash())
+
+
+# 녹화된 마스크를 순서대로 돌려주는 입력
+class ReplayInput:
+    def __init__(self, recording):
+        self.masks = recording.masks
+        self.pos = 0
+
+    def next_mask(self):
+        mask = self.masks[self.pos]
+        self.pos += 1
+        return mask
+
+
+def check(recording, sim):
+    return {
+        "ticks": sim.tick,
+        "score": sim.score,
+        "life": sim.life,
+        "ok": (sim.tick == recording.ticks and sim.score == recording.score and
+               sim.life == recording.life and sim.state_hash() == recording.state_hash),
+    }
+
+
+# ✅ 헤드리스 최고 속도 재생
+def replay_headless(recording):
+    sim = Simulation(recording.width, recording.height, recording.entity_backend,
+                     recording.seed, recording.tuning)
+    for mask in recording.masks:
+        if not sim.running:
+            break
+        sim.update(SIM_DT, KeyState.from_mask(mask))
+    return check(recording, sim)
+
+
+# ✅ 실제 속도로 화면에 재생 (Game 루프 그대로, 입력만 녹화에서)
+def replay_render(recording):
+    from game import Game
+    from screens import PlayScreen
+
+    game = Game(recording.width, recording.height, entity_backend=recording.entity_backend,
+                seed=recording.seed, tuning=recording.tuning)
+    game.replay_input = ReplayInput(recording)
+    game.tick_limit = recording.ticks
+    screen = PlayScreen(game)
+    while game.running and game.tick < recording.ticks:
+        screen.step()
+    return check(recording, game)
+
+
+def collect(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(os.path.join(path, n) for n in os.listdir(path) if n.endswith(EXT)))
+        else:
+            files.append(path)
+    return files
+
+
+def main():
+    import argparse  # CLI 에서만 필요 (Game 이 이 모듈을 import 함)
+
+    parser = argparse.ArgumentParser(description="Star Drift replay / regression check")
+    parser.add_argument("paths", nargs="+", help=f"{EXT} 파일 또는 폴더")
+    parser.add_argument("--render", action="store_true", help="화면에 실제 속도로 재생")
+    args = parser.parse_args()
+
+    if not args.render:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    failed = 0
+    total_ticks = 0
+    start = time.perf_counter()
+    for path in collect(args.paths):
+        rec = Recording.load(path)
+        result = replay_render(rec) if args.render else replay_headless(rec)
+        total_ticks += result["ticks"]
+        status = "OK  " if result["ok"] else "FAIL"
+        failed += not result["ok"]
+        print(f"{status} {os.path.basename(path)}  seed {rec.seed}  ticks {result['ticks']}/{rec.ticks}  "
+              f"score {result['score']}/{rec.score}  life {result['life']}/{rec.life}")
+    elapsed = time.perf_counter() - start
+    if not args.render and elapsed > 0:
+        print(f"{total_ticks} ticks in {elapsed:.2f}s ({total_ticks / elapsed:.0f} ticks/s)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
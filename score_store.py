@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import queue
+import atexit
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_FILE = os.path.join(BASE_DIR, "highscore.json")   # 예전 {"highscore": N} 파일과 호환
+LOG_FILE = os.path.join(BASE_DIR, "scores.log")
+
+
+# ✅ 점수 기록 저장소
+#   - 판마다 append-only 로그(한 줄 JSON)에 추가, 백그라운드 스레드에서 묶어서 fsync
+#   - 일정 개수마다 스냅샷(highscore.json)으로 압축 (임시 파일 -> os.replace 로 원자적 교체)
+#   - 메모리에 상위 N개 리더보드 유지 (최고 점수는 O(1))
+class ScoreStore:
+    def __init__(self, snapshot_path=SNAPSHOT_FILE, log_path=LOG_FILE, top_n=10, compact_every=50):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.top_n = top_n
+        self.compact_every = compact_every
+        self.top = []          # 점수 내림차순
+        self.runs = 0
+        self.seq = 0           # 마지막 기록 번호
+        self._snapshot_seq = 0
+        self._since_compact = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._load()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    @property
+    def highscore(self):
+        return self.top[0]["score"] if self.top else 0
+
+    def leaderboard(self):
+        with self._lock:
+            return list(self.top)
+
+    def _add(self, entry, run=True):
+        self.runs += run
+        self.top.append(entry)
+        self.top.sort(key=lambda e: e["score"], reverse=True)
+        del self.top[self.top_n:]
+
+    # 스냅샷 + 로그 읽기 (끝이 잘린 줄은 무시)
+    def _load(self):
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snap = json.load(f)
+        except (OSError, ValueError):
+            snap = {}
+        try:
+            self._load_snapshot(snap)
+        except (TypeError, ValueError, AttributeError):
+            # 형식이 이상한 스냅샷은 없는 것으로 취급
+            self.top = []
+            self.runs = self.seq = self._snapshot_seq = 0
+
+        # 바이트 단위로 읽음 (텍스트 모드면 윈도우에서 \r\n 때문에 잘라낼 위치가 어긋남)
+        try:
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # 쓰다 만 마지막 줄을 잘라내야 다음 기록이 그 뒤에 붙지 않음
+            try:
+                with open(self.log_path, "r+b") as f:
+                    f.truncate(end)
+            except OSError:
+                pass
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # 기록 중 종료된 마지막 줄
+            if not isinstance(entry, dict) or not self._valid(entry):
+                continue
+            seq = entry.pop("seq", 0)
+            if not isinstance(seq, int):
+                continue
+            if seq <= self._snapshot_seq:
+                continue  # 이미 스냅샷에 들어간 기록
+            self.seq = max(self.seq, seq)
+            self._add(entry)
+            self._since_compact += 1
+
+    def _load_snapshot(self, snap):
+        if not isinstance(snap, dict):
+            raise TypeError("snapshot is not an object")
+        if "top" in snap:
+            top = [e for e in snap["top"] if isinstance(e, dict) and self._valid(e)]
+            runs, seq = int(snap.get("runs", len(top))), int(snap.get("seq", 0))
+            top.sort(key=lambda e: e["score"], reverse=True)
+            self.top = top[:self.top_n]
+            self.runs = runs
+            self.seq = self._snapshot_seq = seq
+        elif snap.get("highscore"):
+            # 예전 형식 {"highscore": N} 마이그레이션 (판 수에는 넣지 않음)
+            self._add({"score": int(snap["highscore"]), "duration": None, "timestamp": None, "seed": None},
+                      run=False)
+
+    @staticmethod
+    def _valid(entry):
+        score = entry.get("score")
+        return isinstance(score, int) and not isinstance(score, bool)
+
+    # ✅ 한 판 기록 (메인 스레드는 메모리만 갱신하고 바로 반환)
+    def record(self, score, duration=None, seed=None, timestamp=None):
+        entry = {
+            "score": int(score),
+            "duration": duration,
+            "timestamp": timestamp if timestamp is not None else time.time(),
+            "seed": seed,
+        }
+        with self._lock:
+            self.seq += 1
+            self._add(entry)
+            self._queue.put(dict(entry, seq=self.seq))
+        return entry
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            entries = [e for e in batch if e is not None]
+            if entries:
+                self._append(entries)
+            if None in batch:
+                return
+
+    def _append(self, entries):
+        try:
+            with open(self.log_path, "ab") as f:
+                for e in entries:
+                    f.write(json.dumps(e).encode("utf-8") + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            return
+        self._since_compact += len(entries)
+        if self._since_compact >= self.compact_every:
+            self.compact()
+
+    # ✅ 로그를 스냅샷으로 합치고 로그 비우기
+    def compact(self):
+        with self._lock:
+            snap = {"highscore": self.highscore, "runs": self.runs, "seq": self.seq, "top": list(self.top)}
+        tmp = self.snapshot_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(snap, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+            self._fsync_dir()
+            # 스냅샷이 안전하게 저장된 뒤에만 로그를 비움 (중간에 꺼져도 seq 로 중복 방지)
+            with open(self.log_path, "wb") as f:
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            return
+        self._snapshot_seq = snap["seq"]
+        self._since_compact = 0
+
+    # 이름 바꾸기(os.replace)가 전원이 꺼져도 남도록 폴더도 fsync (윈도우는 지원 안 함)
+    def _fsync_dir(self):
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(self.snapshot_path)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    # 남은 기록을 모두 쓰고 스레드 종료
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
@@ -0,0 +1,171 @@
+import sys
+import pygame
+from pygame.locals import QUIT, MOUSEBUTTONDOWN, KEYDOWN, K_p, K_ESCAPE, NOEVENT, VIDEOEXPOSE, WINDOWEXPOSED
+
+IDLE_WAIT_MS = 500   # 정적 화면에서 이벤트를 기다리는 최대 시간
+PAUSE_KEYS = (K_p, K_ESCAPE)
+REDRAW_EVENTS = (VIDEOEXPOSE, WINDOWEXPOSED)
+
+
+def quit_game():
+    pygame.quit()
+    sys.exit()
+
+
+# ✅ 게임 화면(상태) 기본형: step() 한 번에 한 프레임, 다음 화면을 반환
+class Screen:
+    def __init__(self, game):
+        self.game = game
+
+    def step(self):
+        return self
+
+
+# ✅ 정적 화면: 한 번 그리고 나면 이벤트가 올 때까지 잠듦 (CPU 거의 0%)
+class StaticScreen(Screen):
+    def __init__(self, game):
+        super().__init__(game)
+        self.dirty = True
+
+    def draw(self):
+        pass
+
+    def handle_event(self, event):
+        return self
+
+    # 창을 닫기 직전 (진행 중인 판이 있으면 기록)
+    def on_quit(self):
+        pass
+
+    def step(self):
+        if self.dirty:
+            self.draw()
+            pygame.display.flip()
+            self.dirty = False
+
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        if event.type == NOEVENT:
+            return self
+        for event in [event] + pygame.event.get():
+            if event.type == QUIT:
+                self.on_quit()
+                quit_game()
+            if event.type in REDRAW_EVENTS or self.game.handle_display_event(event):
+                self.dirty = True
+                continue
+            nxt = self.handle_event(event)
+            if nxt is not self:
+                return nxt
+        return self
+
+
+# ✅ 플레이 화면 (고정 스텝 시뮬레이션 + 렌더)
+class PlayScreen(Screen):
+    def __init__(self, game):
+        super().__init__(game)
+        game.clock.tick()  # 멈춰 있던 시간이 dt 로 들어가지 않게
+        game.profiler.resume()
+        game.renderer.invalidate()
+        self.first = not game.startup.has("first_frame")
+
+    def step(self):
+        game = self.game
+        prof = game.profiler
+        # 첫 프레임은 60fps 제한 대기 없이 바로 그림
+        frame_dt = (game.clock.tick() if self.first else game.clock.tick(60)) / 1000
+        prof.begin_frame()
+        with prof.phase("events"):
+            game.handle_events()
+        with prof.phase("update"):
+            alpha = game.advance(frame_dt)
+        with prof.phase("draw"):
+            if prof.enabled:
+                game.renderer.invalidate()  # 오버레이가 있으면 더티 렉트 대신 전체 갱신
+            game.draw(alpha)
+            prof.draw_overlay(game.screen)
+        with prof.phase("present"):
+            game.renderer.present()
+        prof.end_frame(game)
+        if self.first:
+            self.first = False
+            game.on_first_frame()
+
+        if not game.running:
+            return GameOverScreen(game)
+        if game.pause_requested:
+            game.pause_requested = False
+            return PauseScreen(game)
+        return self
+
+
+# ✅ 일시정지 화면 (마지막 게임 화면 위에 반투명 안내)
+class PauseScreen(StaticScreen):
+    def draw(self):
+        game = self.game
+        game.renderer.invalidate()
+        game.draw(1.0)
+        layer = game.menu_layer("pause", self._build_layer)
+        game.screen.blit(layer, (0, 0))
+
+    def _build_layer(self):
+        game = self.game
+        w, h = game.screen.get_size()
+        layer = pygame.Surface((w, h), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 140))
+        txt = game.title_font.render("PAUSED", True, (255,255,255))
+        layer.blit(txt, (w//2 - txt.get_width()//2, h//2 - 40))
+        hint = game.font.render("P / ESC to resume", True, (200,200,200))
+        layer.blit(hint, (w//2 - hint.get_width()//2, h//2 + 10))
+        return layer
+
+    def handle_event(self, event):
+        if event.type == KEYDOWN and event.key in PAUSE_KEYS:
+            return PlayScreen(self.game)
+        return self
+
+    # 일시정지 중에 닫아도 플레이 중 종료와 같이 점수/녹화 저장
+    def on_quit(self):
+        self.game.running = False
+        self.game.on_game_over()
+
+
+# ✅ 게임 오버 화면 (제목/버튼은 한 번만 렌더해서 재사용)
+class GameOverScreen(StaticScreen):
+    def __init__(self, game):
+        super().__init__(game)
+        self._layout()
+        game.on_game_over()
+
+    # 버튼 위치는 창 가운데 기준 (800x600 에서 (300,350) / (420,350))
+    def _layout(self):
+        w, h = self.game.screen.get_size()
+        self.restart = pygame.Rect(w//2 - 100, h//2 + 50, 100, 40)
+        self.quit_btn = pygame.Rect(w//2 + 20, h//2 + 50, 100, 40)
+
+    def draw(self):
+        self._layout()
+        self.game.screen.blit(self.game.menu_layer("game_over", self._build_layer), (0, 0))
+
+    def _build_layer(self):
+        game = self.game
+        w, h = game.screen.get_size()
+        layer = pygame.Surface((w, h))
+        layer.fill((0,0,0))
+        txt = game.title_font.render("THE FORCE WAS NOT WITH YOU", True, (255,0,0))
+        layer.blit(txt, (w//2 - txt.get_width()//2, h//2 - 100))
+
+        restart, quit_btn = self.restart, self.quit_btn
+        pygame.draw.rect(layer, (70,70,200), restart)
+        pygame.draw.rect(layer, (200,70,70), quit_btn)
+        layer.blit(game.font.render("Restart", True, (255,255,255)), (restart.x+10, restart.y+10))
+        layer.blit(game.font.render("Quit", True, (255,255,255)), (quit_btn.x+25, quit_btn.y+10))
+        return layer
+
+    def handle_event(self, event):
+        if event.type == MOUSEBUTTONDOWN:
+            if self.restart.collidepoint(event.pos):
+                self.game.reset_game()
+                return PlayScreen(self.game)
+            if self.quit_btn.collidepoint(event.pos):
+                quit_game()
+        return self
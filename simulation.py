@@ -0,0 +1,263 @@
+import random
+import struct
+from player import Player, KeyState
+from enemy import Enemy
+from item import Item
+from pool import EntityPool
+from entity_store import EntityStore, KIND_ENEMY, KIND_ITEM, KIND_HEAL
+
+# 고정 시뮬레이션 스텝 (렌더 FPS 와 무관하게 같은 결과)
+SIM_HZ = 120
+SIM_DT = 1.0 / SIM_HZ
+MAX_FRAME_DT = 0.25  # 렉이 심할 때 한 번에 따라잡을 최대 시간
+
+NO_KEYS = KeyState()
+
+
+# tuning 으로 덮어쓸 수 있는 밸런스 값
+TUNING_KEYS = ("enemy_interval", "item_interval", "enemy_speed", "start_invincible", "hit_invincible", "max_life")
+
+
+# ✅ 화면/사운드 없이 돌아가는 게임 로직 (Game 이 상속해서 그리기/소리를 붙임)
+class Simulation:
+    # 밸런스 값 (기본값)
+    enemy_interval = 0.8
+    item_interval = 4.0
+    enemy_speed = (120, 240)
+    start_invincible = 2.0
+    hit_invincible = 1.5
+    max_life = 3
+
+    def __init__(self, width=800, height=600, entity_backend="objects", seed=None, tuning=None):
+        for key, value in (tuning or {}).items():
+            if key not in TUNING_KEYS:
+                raise ValueError(f"unknown tuning key: {key}")
+            setattr(self, key, value)
+
+        self.width = width
+        self.height = height
+        self.entity_backend = entity_backend
+        self.tuning = dict(tuning or {})
+
+        # 게임 오브젝트
+        self.enemies = []
+        self.items = []
+        self.enemy_pool = EntityPool(Enemy)
+        self.item_pool = EntityPool(Item)
+
+        # 엔티티 백엔드: "objects" = Enemy/Item 객체, "numpy" = EntityStore (대량 처리용)
+        self.store = EntityStore() if entity_backend == "numpy" else None
+
+        # 누적 카운터 (프로파일러용)
+        self.spawn_count = 0
+        self._checks = 0
+
+        # 재생 시 이 스텝까지만 진행 (None 이면 제한 없음)
+        self.tick_limit = None
+
+        self.start_run(seed)
+
+    # ✅ 한 판 시작 (시드만 같으면 항상 같은 초기 상태)
+    def start_run(self, seed=None):
+        # 시드 고정 난수 (같은 시드 + 같은 입력 = 같은 결과)
+        #   (녹화 파일에 unsigned 64bit 로 저장되므로 그 범위로 맞춤)
+        self.seed = seed % 2 ** 64 if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.tick = 0
+        self.accumulator = 0.0
+
+        # 생명(하트)
+        self.life = self.max_life
+
+        self.player = Player(self.width // 2, self.height - 80)
+        self.enemy_pool.release_all(self.enemies)
+        self.item_pool.release_all(self.items)
+        self.enemies.clear()
+        self.items.clear()
+        if self.store is not None:
+            self.store.clear()
+
+        # 타이머 및 점수
+        self.spawn_timer = -0.5
+        self.item_timer = 0.0
+        self.score = 0
+        self.invincible_time = self.start_invincible
+        self.running = True
+
+    # 피격/획득 등 이벤트 알림 (Game 에서 효과음 재생)
+    def on_event(self, name):
+        pass
+
+    # 입력 읽기 (헤드리스는 아무 키도 안 누름)
+    def read_keys(self):
+        return NO_KEYS
+
+    # 충돌 검사 횟수 (누적)
+    @property
+    def collision_checks(self):
+        return self._checks
+
+    # 적 스폰
+    def spawn_enemy(self):
+        self.spawn_count += 1
+        x = self.rng.randint(50, self.width - 50)
+        if self.store is not None:
+            self.store.spawn_enemy(self.width, spawn_x=x, rng=self.rng, speed_range=self.enemy_speed)
+            return
+        e = self.enemy_pool.acquire(self.width, spawn_x=x, rng=self.rng, speed_range=self.enemy_speed)
+        e.seq = self.spawn_count
+        self.enemies.append(e)
+
+    # 아이템 스폰
+    def spawn_item(self):
+        self.spawn_count += 1
+        if self.store is not None:
+            self.store.spawn_item(self.width, rng=self.rng)
+            return
+        it = self.item_pool.acquire(self.width, rng=self.rng)
+        self.items.append(it)
+
+    # 화면 아래로 나간 엔티티 정리 -> 풀로 반납
+    def retire(self, obj, objs, pool):
+        objs.remove(obj)
+        pool.release(obj)
+
+    # ✅ 살아있는/풀에 대기 중인 엔티티 수
+    def entity_counts(self):
+        if self.store is not None:
+            return {
+                "enemies": self.store.count((KIND_ENEMY,)),
+                "items": self.store.count((KIND_ITEM, KIND_HEAL)),
+                "store_free": self.store.free_slots(),
+            }
+        return {
+            "enemies": len(self.enemies),
+            "items": len(self.items),
+            "enemy_pool": self.enemy_pool.pooled,
+            "item_pool": self.item_pool.pooled,
+        }
+
+    # ✅ 프레임 시간만큼 고정 스텝을 진행하고, 렌더 보간 비율(0~1)을 반환
+    def advance(self, frame_dt, keys=None):
+        self.accumulator += min(frame_dt, MAX_FRAME_DT)
+        while self.accumulator >= SIM_DT and self.running:
+            if self.tick_limit is not None and self.tick >= self.tick_limit:
+                break
+            self.update(SIM_DT, keys)
+            self.accumulator -= SIM_DT
+        return self.accumulator / SIM_DT
+
+    # ✅ 게임 업데이트 (한 스텝)
+    def update(self, dt, keys=None):
+        self.tick += 1
+        if self.invincible_time > 0:
+            self.invincible_time -= dt
+
+        if keys is None:
+            keys = self.read_keys()
+        self.player.move(keys, dt, self.width, self.height)
+
+        self.spawn_timer += dt
+        if self.spawn_timer > self.enemy_interval:
+            self.spawn_enemy()
+            self.spawn_timer = 0
+
+        self.item_timer += dt
+        if self.item_timer > self.item_interval:
+            self.spawn_item()
+            self.item_timer = 0
+
+        # 충돌 처리
+        if self.store is not None:
+            self.update_store(dt)
+        else:
+            self.update_objects(dt)
+
+    # 객체 방식 이동/충돌 (이동하는 김에 플레이어와 바로 검사)
+    #   스텝당 질의가 플레이어 하나뿐이라 매 스텝 공간 해시를 갱신하는 것보다 전체 순회가 빠름
+    def update_objects(self, dt):
+        prect = self.player.rect
+        hit_enemies = []
+        hit_items = []
+        for e in self.enemies[:]:
+            e.update(dt)
+            if e.rect.top > self.height:
+                self.retire(e, self.enemies, self.enemy_pool)
+            elif e.rect.colliderect(prect):
+                hit_enemies.append(e)
+        for it in self.items[:]:
+            it.update(dt)
+            if it.rect.top > self.height:
+                self.retire(it, self.items, self.item_pool)
+            elif it.rect.colliderect(prect):
+                hit_items.append(it)
+        self._checks += len(self.enemies) + len(self.items)
+
+        if hit_enemies and self.invincible_time <= 0:
+            # 가장 먼저 스폰된 적 하나만 맞음
+            e = min(hit_enemies, key=lambda o: o.seq)
+            self.on_event("hit")
+            self.life -= 1
+            self.invincible_time = self.hit_invincible
+            self.retire(e, self.enemies, self.enemy_pool)
+            if self.life <= 0:
+                self.running = False
+                return
+
+        for it in hit_items:
+            self.on_event("pick")
+            self.retire(it, self.items, self.item_pool)
+            if getattr(it, "is_heal", False):
+                if self.life < self.max_life:
+                    self.life += 1
+            else:
+                self.score += it.value
+
+    # ✅ numpy 방식 이동/충돌 (한 번에 이동, 한 번에 AABB 판정)
+    def update_store(self, dt):
+        store = self.store
+        store.update(dt, self.height)
+        self._checks += store.count((KIND_ENEMY, KIND_ITEM, KIND_HEAL))
+
+        if self.invincible_time <= 0:
+            hits = store.collide(self.player.rect, (KIND_ENEMY,))
+            if len(hits):
+                # 객체 방식과 동일하게 가장 먼저 스폰된 적 하나만 맞음
+                store.kill(hits[0])
+                self.on_event("hit")
+                self.life -= 1
+                self.invincible_time = self.hit_invincible
+                if self.life <= 0:
+                    self.running = False
+                    return
+
+        for i in store.collide(self.player.rect, (KIND_ITEM, KIND_HEAL)):
+            store.kill(i)
+            self.on_event("pick")
+            if store.kind[i] == KIND_HEAL:
+                if self.life < self.max_life:
+                    self.life += 1
+            else:
+                self.score += int(store.value[i])
+
+    # ✅ 시뮬레이션 상태 해시 (결정성 확인용)
+    def state_hash(self):
+        import hashlib  # 검증할 때만 필요 (시작 시간 절약)
+        h = hashlib.sha1()
+        p = self.player
+        h.update(struct.pack("<qqqddd", self.tick, self.score, self.life,
+                             self.spawn_timer, self.item_timer, self.invincible_time))
+        h.update(struct.pack("<dd", p.x, p.y))
+        if self.store is not None:
+            a = self.store.alive
+            h.update(self.store.x[a].tobytes())
+            h.update(self.store.y[a].tobytes())
+        for e in self.enemies:
+            h.update(struct.pack("<idd", e.rect.x, e.y, e.speed))
+        for it in self.items:
+            h.update(struct.pack("<idd", it.rect.x, it.y, it.speed))
+        return h.hexdigest()
+
+    # ✅ 게임 리셋 (새 시드로 새 판)
+    def reset_game(self, seed=None):
+        self.start_run(seed)
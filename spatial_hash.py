@@ -0,0 +1,106 @@
+import pygame
+
+
+# ✅ 균일 격자 공간 해시 (화면을 cell_size 칸으로 나눠 근처 엔티티만 찾음)
+class SpatialHash:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._cells = {}    # (cx, cy) -> {obj: None} (삽입 순서 유지)
+        self._entries = {}  # obj -> (rect, 차지한 칸 범위)
+        self.checks = 0     # 질의에서 실제로 겹침 검사한 횟수 (누적)
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, rect.top // cs,
+                (rect.right - 1) // cs, (rect.bottom - 1) // cs)
+
+    def _add_cells(self, obj, cr):
+        x0, y0, x1, y1 = cr
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._cells.setdefault((cx, cy), {})[obj] = None
+
+    def _remove_cells(self, obj, cr):
+        x0, y0, x1, y1 = cr
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(obj, None)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return obj in self._entries
+
+    def insert(self, obj, rect):
+        if obj in self._entries:
+            self.move(obj, rect)
+            return
+        cr = self._cell_range(rect)
+        self._entries[obj] = (rect, cr)
+        self._add_cells(obj, cr)
+
+    # ✅ 이동: 차지한 칸이 바뀐 경우에만 격자를 갱신
+    def move(self, obj, rect):
+        entry = self._entries.get(obj)
+        if entry is None:
+            self.insert(obj, rect)
+            return
+        # 매 프레임 모든 엔티티가 호출하므로 _cell_range 를 풀어서 계산
+        cs = self.cell_size
+        x, y, w, h = rect
+        cr = (x // cs, y // cs, (x + w - 1) // cs, (y + h - 1) // cs)
+        if cr == entry[1] and rect is entry[0]:
+            return
+        if cr != entry[1]:
+            self._remove_cells(obj, entry[1])
+            self._add_cells(obj, cr)
+        self._entries[obj] = (rect, cr)
+
+    def remove(self, obj):
+        entry = self._entries.pop(obj, None)
+        if entry is not None:
+            self._remove_cells(obj, entry[1])
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+
+    def _candidates(self, cr):
+        x0, y0, x1, y1 = cr
+        seen = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    seen.update(cell)
+        return seen
+
+    # ✅ rect 와 겹치는 엔티티
+    def query_rect(self, rect):
+        rect = pygame.Rect(rect)
+        candidates = self._candidates(self._cell_range(rect))
+        self.checks += len(candidates)
+        return [obj for obj in candidates if rect.colliderect(self._entries[obj][0])]
+
+    # ✅ 점을 포함하는 엔티티
+    def query_point(self, x, y):
+        cs = self.cell_size
+        cell = self._cells.get((int(x) // cs, int(y) // cs), {})
+        return [obj for obj in cell if self._entries[obj][0].collidepoint(x, y)]
+
+    # ✅ 원(중심, 반지름)과 겹치는 엔티티 (자석 아이템 등)
+    def query_radius(self, x, y, r):
+        bounds = pygame.Rect(int(x - r), int(y - r), int(2 * r) + 1, int(2 * r) + 1)
+        found = []
+        for obj in self._candidates(self._cell_range(bounds)):
+            rect = self._entries[obj][0]
+            nx = min(max(x, rect.left), rect.right)
+            ny = min(max(y, rect.top), rect.bottom)
+            if (nx - x) ** 2 + (ny - y) ** 2 <= r * r:
+                found.append(obj)
+        return found